@@ -4,77 +4,74 @@ HTTP Endpoint Input Plugin
 Receives logs via HTTP POST requests
 """
 
-import sys
-sys.path.append('..')
-
 from plugin_manager import InputPlugin, PluginMetadata, ConfigField, PluginType
 from typing import Dict, List, Any, Optional
+from array import array
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 class HTTPInputPlugin(InputPlugin):
     """HTTP endpoint for receiving logs"""
     
-    @property
-    def metadata(self) -> PluginMetadata:
-        return PluginMetadata(
-            name="HTTP Endpoint",
-            version="1.0.0",
-            author="AI/ML Observability Platform",
-            description="Receive logs via HTTP POST requests. Perfect for applications that can send logs directly to a REST endpoint.",
-            category=PluginType.INPUT,
-            documentation_url="https://docs.aiml-obs.com/plugins/http-input",
-            icon_url="https://cdn.aiml-obs.com/icons/http.png",
-            tags=["http", "api", "webhook", "rest"],
-            pricing="free"
-        )
+    # Built once at import and shared by every instance; treat as read-only
+    metadata = PluginMetadata(
+        name="HTTP Endpoint",
+        version="1.0.0",
+        author="AI/ML Observability Platform",
+        description="Receive logs via HTTP POST requests. Perfect for applications that can send logs directly to a REST endpoint.",
+        category=PluginType.INPUT,
+        documentation_url="https://docs.aiml-obs.com/plugins/http-input",
+        icon_url="https://cdn.aiml-obs.com/icons/http.png",
+        tags=["http", "api", "webhook", "rest"],
+        pricing="free"
+    )
     
-    @property
-    def config_schema(self) -> List[ConfigField]:
-        return [
-            ConfigField(
-                name="port",
-                type="number",
-                label="Listen Port",
-                description="Port number to listen on (1024-65535)",
-                required=True,
-                default=8080,
-                validation="^(102[4-9]|10[3-9]\\d|1[1-9]\\d{2}|[2-9]\\d{3}|[1-5]\\d{4}|6[0-4]\\d{3}|65[0-4]\\d{2}|655[0-2]\\d|6553[0-5])$"
-            ),
-            ConfigField(
-                name="path",
-                type="string",
-                label="Endpoint Path",
-                description="URL path for log ingestion",
-                required=True,
-                default="/logs",
-                placeholder="/logs"
-            ),
-            ConfigField(
-                name="auth_token",
-                type="secret",
-                label="Authentication Token",
-                description="Bearer token required for requests (leave empty for no auth)",
-                required=False,
-                placeholder="your-secret-token-here"
-            ),
-            ConfigField(
-                name="format",
-                type="select",
-                label="Expected Format",
-                description="Format of incoming log data",
-                required=True,
-                default="json",
-                options=["json", "text", "auto"]
-            ),
-            ConfigField(
-                name="batch_size",
-                type="number",
-                label="Batch Size",
-                description="Number of logs to collect before processing",
-                required=False,
-                default=100
-            )
-        ]
+    config_schema = [
+        ConfigField(
+            name="port",
+            type="number",
+            label="Listen Port",
+            description="Port number to listen on (1024-65535)",
+            required=True,
+            default=8080
+        ),
+        ConfigField(
+            name="path",
+            type="string",
+            label="Endpoint Path",
+            description="URL path for log ingestion",
+            required=True,
+            default="/logs",
+            placeholder="/logs"
+        ),
+        ConfigField(
+            name="auth_token",
+            type="secret",
+            label="Authentication Token",
+            description="Bearer token required for requests (leave empty for no auth)",
+            required=False,
+            placeholder="your-secret-token-here"
+        ),
+        ConfigField(
+            name="format",
+            type="select",
+            label="Expected Format",
+            description="Format of incoming log data",
+            required=True,
+            default="json",
+            options=["json", "text", "auto"]
+        ),
+        ConfigField(
+            name="batch_size",
+            type="number",
+            label="Batch Size",
+            description="Number of logs to collect before processing",
+            required=False,
+            default=100
+        )
+    ]
     
     def validate_config(self, config: Dict[str, Any]) -> tuple[bool, Optional[str]]:
         # Validate port range
@@ -96,14 +93,23 @@ class HTTPInputPlugin(InputPlugin):
     
     def initialize(self, config: Dict[str, Any]) -> None:
         self.config = config
-        self.buffer = []
+        # Resolved once so the per-event paths read attributes instead of probing the config dict
+        self._port = config['port']
+        self._path = config['path']
+        self._batch = config.get('batch_size', 100)
+        # Column-oriented buffer: timestamps packed as C doubles, payloads in a parallel list.
+        # Event dicts are only built when a batch is collected.
+        self._ts = array('d')
+        self._data = []
+        self._capacity = max(self._batch * 4, 4096)
         self.total_received = 0
+        self.total_dropped = 0
         # In real implementation, start HTTP server here
-        print(f"HTTP Input Plugin initialized on port {config['port']}, path {config['path']}")
+        logger.info("HTTP Input Plugin initialized on port %s, path %s", self._port, self._path)
     
     def test_connection(self) -> tuple[bool, Optional[str]]:
         # In real implementation, test if port is available
-        return True, f"HTTP endpoint ready at :{self.config['port']}{self.config['path']}"
+        return True, f"HTTP endpoint ready at :{self._port}{self._path}"
     
     def collect(self) -> List[Dict[str, Any]]:
         """
@@ -111,36 +117,44 @@ class HTTPInputPlugin(InputPlugin):
         For demo, we'll simulate receiving logs
         """
         # Simulate some logs in buffer
-        if len(self.buffer) < self.config.get('batch_size', 100):
+        # receive_log appends the timestamp before the payload, so the payload column is never longer
+        n = len(self._data)
+        if n < self._batch:
             # Not enough logs yet
             return []
         
-        # Return buffered logs
-        events = self.buffer.copy()
-        self.buffer = []
-        return events
+        # Drain only what was counted so concurrent receive_log calls land in the next batch
+        timestamps = self._ts[:n]
+        payloads = self._data[:n]
+        del self._ts[:n]
+        del self._data[:n]
+        
+        # Each event gets its own metadata dict, since processors may enrich it in place
+        port, path = self._port, self._path
+        return [
+            {'timestamp': ts, 'source': 'http_endpoint', 'data': data, 'metadata': {'port': port, 'path': path}}
+            for ts, data in zip(timestamps, payloads)
+        ]
     
     def receive_log(self, data: Dict[str, Any]) -> bool:
         """Method called by HTTP server when log is received"""
-        self.buffer.append({
-            'timestamp': time.time(),
-            'source': 'http_endpoint',
-            'data': data,
-            'metadata': {
-                'port': self.config['port'],
-                'path': self.config['path']
-            }
-        })
+        if len(self._data) >= self._capacity:
+            # Buffer full: reject so the server can apply backpressure
+            self.total_dropped += 1
+            return False
+        self._ts.append(time.time())
+        self._data.append(data)
         self.total_received += 1
         return True
     
     def health_check(self) -> Dict[str, Any]:
         return {
             "status": "healthy",
-            "message": f"HTTP endpoint listening on :{self.config['port']}{self.config['path']}",
+            "message": f"HTTP endpoint listening on :{self._port}{self._path}",
             "metrics": {
                 "total_received": self.total_received,
-                "buffer_size": len(self.buffer),
-                "port": self.config['port']
+                "buffer_size": len(self._data),
+                "total_dropped": self.total_dropped,
+                "port": self._port
             }
         }
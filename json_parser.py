@@ -4,86 +4,108 @@ JSON Parser Processing Plugin
 Parses JSON log messages and extracts fields
 """
 
-import sys
-sys.path.append('..')
-
 from plugin_manager import ProcessingPlugin, PluginMetadata, ConfigField, PluginType
 from typing import Dict, List, Any, Optional
 import json
 
+# Optional fast JSON decoders, used when the fast_decoder option is on; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
 class JSONParserPlugin(ProcessingPlugin):
     """Parse JSON log messages and extract structured fields"""
     
-    @property
-    def metadata(self) -> PluginMetadata:
-        return PluginMetadata(
-            name="JSON Parser",
-            version="1.0.0",
-            author="AI/ML Observability Platform",
-            description="Parse JSON-formatted log messages and extract fields into structured format. Handles nested JSON and arrays.",
-            category=PluginType.PROCESSING,
-            documentation_url="https://docs.aiml-obs.com/plugins/json-parser",
-            icon_url="https://cdn.aiml-obs.com/icons/json.png",
-            tags=["parser", "json", "transform"],
-            pricing="free"
-        )
+    # Built once at import and shared by every instance; treat as read-only
+    metadata = PluginMetadata(
+        name="JSON Parser",
+        version="1.0.0",
+        author="AI/ML Observability Platform",
+        description="Parse JSON-formatted log messages and extract fields into structured format. Handles nested JSON and arrays.",
+        category=PluginType.PROCESSING,
+        documentation_url="https://docs.aiml-obs.com/plugins/json-parser",
+        icon_url="https://cdn.aiml-obs.com/icons/json.png",
+        tags=["parser", "json", "transform"],
+        pricing="free"
+    )
     
-    @property
-    def config_schema(self) -> List[ConfigField]:
-        return [
-            ConfigField(
-                name="source_field",
-                type="string",
-                label="Source Field",
-                description="Field containing JSON string to parse (e.g., 'message', 'data')",
-                required=True,
-                default="message",
-                placeholder="message"
-            ),
-            ConfigField(
-                name="target_field",
-                type="string",
-                label="Target Field",
-                description="Where to store parsed JSON (leave empty to merge into root)",
-                required=False,
-                default="",
-                placeholder="parsed"
-            ),
-            ConfigField(
-                name="flatten",
-                type="boolean",
-                label="Flatten Nested Objects",
-                description="Convert nested JSON to flat structure with dot notation (e.g., user.name)",
-                required=False,
-                default=False
-            ),
-            ConfigField(
-                name="prefix",
-                type="string",
-                label="Field Prefix",
-                description="Add prefix to all extracted fields (e.g., 'json_')",
-                required=False,
-                default="",
-                placeholder="json_"
-            ),
-            ConfigField(
-                name="keep_original",
-                type="boolean",
-                label="Keep Original Field",
-                description="Retain the original source field after parsing",
-                required=False,
-                default=True
-            ),
-            ConfigField(
-                name="on_error",
-                type="select",
-                label="On Parse Error",
-                description="What to do when JSON parsing fails",
-                required=True,
-                default="keep",
-                options=["keep", "drop", "mark"]
-            )
-        ]
+    config_schema = [
+        ConfigField(
+            name="source_field",
+            type="string",
+            label="Source Field",
+            description="Field containing JSON string to parse (e.g., 'message', 'data')",
+            required=True,
+            default="message",
+            placeholder="message"
+        ),
+        ConfigField(
+            name="target_field",
+            type="string",
+            label="Target Field",
+            description="Where to store parsed JSON (leave empty to merge into root)",
+            required=False,
+            default="",
+            placeholder="parsed"
+        ),
+        ConfigField(
+            name="fields",
+            type="string",
+            label="Extract Fields",
+            description="Comma-separated JSON Pointers to extract instead of the whole document (e.g., /user/id, /level). Leave empty to parse everything",
+            required=False,
+            default="",
+            placeholder="/user/id, /level"
+        ),
+        ConfigField(
+            name="flatten",
+            type="boolean",
+            label="Flatten Nested Objects",
+            description="Convert nested JSON to flat structure with dot notation (e.g., user.name)",
+            required=False,
+            default=False
+        ),
+        ConfigField(
+            name="prefix",
+            type="string",
+            label="Field Prefix",
+            description="Add prefix to all extracted fields (e.g., 'json_')",
+            required=False,
+            default="",
+            placeholder="json_"
+        ),
+        ConfigField(
+            name="keep_original",
+            type="boolean",
+            label="Keep Original Field",
+            description="Retain the original source field after parsing",
+            required=False,
+            default=True
+        ),
+        ConfigField(
+            name="fast_decoder",
+            type="boolean",
+            label="Fast JSON Decoder",
+            description="Parse with orjson or simdjson when installed. Faster, but integers wider than 64 bits may lose precision",
+            required=False,
+            default=False
+        ),
+        ConfigField(
+            name="on_error",
+            type="select",
+            label="On Parse Error",
+            description="What to do when JSON parsing fails",
+            required=True,
+            default="keep",
+            options=["keep", "drop", "mark"]
+        )
+    ]
     
     def validate_config(self, config: Dict[str, Any]) -> tuple[bool, Optional[str]]:
         if not config.get('source_field'):
@@ -93,98 +115,222 @@ class JSONParserPlugin(ProcessingPlugin):
         if on_error not in ['keep', 'drop', 'mark']:
             return False, "on_error must be one of: keep, drop, mark"
         
+        for pointer in self._split_fields(config.get('fields')):
+            if not pointer.startswith('/'):
+                return False, f"Field '{pointer}' is not a JSON Pointer (must start with /)"
+        
         return True, None
     
     def initialize(self, config: Dict[str, Any]) -> None:
         self.config = config
+        # Resolved once so process() reads attributes instead of probing the config dict per event
+        self._src = config['source_field']
+        self._tgt = config.get('target_field') or ''
+        self._prefix = config.get('prefix') or ''
+        self._flatten = bool(config.get('flatten', False))
+        self._keep_original = bool(config.get('keep_original', True))
         self.parse_success = 0
         self.parse_errors = 0
+        fast = bool(config.get('fast_decoder', False))
+        # simdjson parsers keep their buffers between documents, so reuse one per instance
+        self._parser = simdjson.Parser() if fast and simdjson is not None else None
+        self._loads = self._select_loads(fast)
+        # Resolve the on_error policy once instead of branching on it for every failed event
+        self._handle_error = {
+            'drop': self._drop,
+            'mark': self._mark,
+            'keep': self._keep
+        }[config.get('on_error', 'keep')]
+        # (output key, pointer, unescaped tokens) for each requested field
+        self._pointers = []
+        for pointer in self._split_fields(config.get('fields')):
+            tokens = tuple(t.replace('~1', '/').replace('~0', '~') for t in pointer[1:].split('/'))
+            self._pointers.append((".".join(tokens), pointer, tokens))
+    
+    def _select_loads(self, fast: bool):
+        """Pick the JSON decoder: stdlib json unless a fast one is enabled and installed"""
+        if fast and orjson is not None:
+            fast_loads = orjson.loads
+        elif self._parser is not None:
+            parser = self._parser
+            fast_loads = lambda raw: parser.parse(raw.encode() if isinstance(raw, str) else raw, True)
+        else:
+            return json.loads
+        
+        def loads(raw):
+            try:
+                return fast_loads(raw)
+            except ValueError:
+                # The fast decoders reject input json accepts (NaN, Infinity); let json decide
+                return json.loads(raw)
+        return loads
+    
+    @staticmethod
+    def _split_fields(fields: Any) -> List[str]:
+        """Normalize the fields option (list or comma-separated string) to a list of pointers"""
+        if not fields:
+            return []
+        if isinstance(fields, str):
+            fields = fields.split(',')
+        return [f.strip() for f in fields if f.strip()]
+    
+    def _extract_fields(self, source_value: Any) -> Dict[str, Any]:
+        """Materialize only the configured JSON Pointer paths of a document"""
+        if isinstance(source_value, dict):
+            doc, lazy = source_value, False
+        elif self._parser is not None:
+            # simdjson proxies are only converted to Python objects for the requested subtrees
+            try:
+                doc = self._parser.parse(source_value.encode() if isinstance(source_value, str) else source_value)
+            except ValueError:
+                # Same fallback as _select_loads(): json accepts NaN/Infinity, simdjson does not
+                doc, lazy = json.loads(source_value), False
+            else:
+                lazy = isinstance(doc, (simdjson.Object, simdjson.Array))
+        else:
+            doc, lazy = self._loads(source_value), False
+        
+        extracted = {}
+        for key, pointer, tokens in self._pointers:
+            try:
+                if lazy:
+                    value = doc.at_pointer(pointer)
+                    if isinstance(value, simdjson.Object):
+                        value = value.as_dict()
+                    elif isinstance(value, simdjson.Array):
+                        value = value.as_list()
+                else:
+                    value = doc
+                    for token in tokens:
+                        if isinstance(value, list):
+                            if not token.isdigit():
+                                raise KeyError(token)
+                            value = value[int(token)]
+                        else:
+                            value = value[token]
+            except (LookupError, TypeError):
+                # Path not present in this document
+                continue
+            extracted[key] = value
+        return extracted
     
-    def _flatten_dict(self, d: Dict, parent_key: str = '', sep: str = '.') -> Dict:
-        """Flatten nested dictionary"""
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
+    def _flatten_dict(self, d: Dict, parent_key: str = '', sep: str = '.', prefix: str = '') -> Dict:
+        """Flatten nested dictionary, prepending prefix to every output key"""
+        # Iterative depth-first walk; keeping a stack of item iterators preserves the key order
+        # (and so the merge precedence) of the recursive version without a frame per level
+        flat = {}
+        stack = [(parent_key, iter(d.items()))]
+        while stack:
+            parent, items = stack[-1]
+            for k, v in items:
+                new_key = f"{parent}{sep}{k}" if parent else k
+                if type(v) is dict:
+                    stack.append((new_key, iter(v.items())))
+                    break
+                flat[f"{prefix}{new_key}" if prefix else new_key] = v
             else:
-                items.append((new_key, v))
-        return dict(items)
+                stack.pop()
+        return flat
     
     def process(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Process a single event"""
-        source_field = self.config['source_field']
-        target_field = self.config.get('target_field', '')
+        result, ok, err = self._process_one(event)
+        self.parse_success += ok
+        self.parse_errors += err
+        return result
+    
+    def _process_one(self, event: Dict[str, Any]) -> tuple[Optional[Dict[str, Any]], int, int]:
+        """
+        Parse one event; the single implementation behind process() and process_batch()
+        Returns: (result, successes, errors), leaving the counters to the caller
+        """
+        source_field = self._src
+        target_field = self._tgt
         
         # Get source value
         if source_field not in event:
             # Source field doesn't exist, pass through
-            return event
+            return event, 0, 0
         
         source_value = event[source_field]
         
-        try:
-            # Parse JSON
-            if isinstance(source_value, str):
-                parsed = json.loads(source_value)
-            elif isinstance(source_value, dict):
-                parsed = source_value
-            else:
-                # Not a string or dict, can't parse
-                return self._handle_error(event)
-            
-            # Flatten if requested
-            if self.config.get('flatten', False):
-                parsed = self._flatten_dict(parsed)
-            
-            # Add prefix if specified
-            prefix = self.config.get('prefix', '')
-            if prefix:
-                parsed = {f"{prefix}{k}": v for k, v in parsed.items()}
-            
-            # Store result
-            if target_field:
-                # Store in specific field
-                event[target_field] = parsed
-            else:
-                # Merge into root
-                event.update(parsed)
-            
-            # Remove original field if requested
-            if not self.config.get('keep_original', True):
-                del event[source_field]
-            
-            self.parse_success += 1
-            return event
-            
-        except json.JSONDecodeError as e:
-            self.parse_errors += 1
-            return self._handle_error(event, str(e))
-    
-    def _handle_error(self, event: Dict[str, Any], error: str = "Not valid JSON") -> Optional[Dict[str, Any]]:
-        """Handle parsing error according to config"""
-        on_error = self.config.get('on_error', 'keep')
+        # Parse JSON
+        if type(source_value) is dict and not self._pointers:
+            # Already parsed upstream: nothing to decode, so no try block is needed
+            parsed = source_value
+        elif isinstance(source_value, (str, dict)):
+            try:
+                if self._pointers:
+                    parsed = self._extract_fields(source_value)
+                elif isinstance(source_value, str):
+                    parsed = self._loads(source_value)
+                else:
+                    parsed = source_value
+            except ValueError as e:
+                # json.JSONDecodeError, orjson.JSONDecodeError and simdjson errors are all ValueErrors
+                return self._handle_error(event, str(e)), 0, 1
+        else:
+            # Not a string or dict, can't parse
+            return self._handle_error(event), 0, 0
+        
+        # Flatten if requested; the prefix is applied in the same pass over the keys
+        prefix = self._prefix
+        if self._flatten:
+            parsed = self._flatten_dict(parsed, prefix=prefix)
+            prefix = ''
         
-        if on_error == 'drop':
-            # Drop the event
-            return None
-        elif on_error == 'mark':
-            # Mark as parse error
-            event['_parse_error'] = error
-            event['_parser'] = 'json_parser'
-            return event
-        else:  # 'keep'
-            # Keep as-is
-            return event
+        # Remove original field if requested. Popping before the merge lets the dict reuse the
+        # freed slot, and a parsed field (or target_field) with the same name is kept
+        if not self._keep_original:
+            event.pop(source_field, None)
+        
+        # Store result, adding the prefix (if any) as keys are written
+        if target_field:
+            # Store in specific field
+            event[target_field] = {f"{prefix}{k}": v for k, v in parsed.items()} if prefix else parsed
+        elif prefix:
+            # Merge into root without building an intermediate prefixed dict
+            for k, v in parsed.items():
+                event[f"{prefix}{k}"] = v
+        else:
+            # Merge into root
+            event.update(parsed)
+        
+        return event, 1, 0
+    
+    # Parse error handlers; initialize() binds the configured one to self._handle_error
+    def _drop(self, event: Dict[str, Any], error: str = "Not valid JSON") -> Optional[Dict[str, Any]]:
+        """Drop the event"""
+        return None
+    
+    def _mark(self, event: Dict[str, Any], error: str = "Not valid JSON") -> Optional[Dict[str, Any]]:
+        """Mark the event as a parse error"""
+        event['_parse_error'] = error
+        event['_parser'] = 'json_parser'
+        return event
+    
+    def _keep(self, event: Dict[str, Any], error: str = "Not valid JSON") -> Optional[Dict[str, Any]]:
+        """Keep the event as-is"""
+        return event
     
     def process_batch(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process batch of events"""
-        processed = []
-        for event in events:
-            result = self.process(event)
-            if result is not None:
-                processed.append(result)
-        return processed
+        process_one = self._process_one
+        results = []
+        append = results.append
+        # Counted in locals and added to the instance counters once per batch
+        ok = err = 0
+        try:
+            for event in events:
+                result, event_ok, event_err = process_one(event)
+                ok += event_ok
+                err += event_err
+                if result is not None:
+                    append(result)
+        finally:
+            self.parse_success += ok
+            self.parse_errors += err
+        return results
     
     def health_check(self) -> Dict[str, Any]:
         total = self.parse_success + self.parse_errors
@@ -5,16 +5,17 @@ Handles plugin registration, configuration, and execution
 """
 
 import json
-import importlib
-import inspect
 from typing import Dict, List, Any, Optional, Type
-from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Installed packages expose plugin classes under this entry-point group
+PLUGIN_ENTRY_POINT_GROUP = "aiml_obs.plugins"
+
 class PluginType(Enum):
     INPUT = "input"
     PROCESSING = "processing"
@@ -22,7 +23,7 @@ class PluginType(Enum):
     ALERT = "alert"
     ANALYTICS = "analytics"
 
-@dataclass
+@dataclass(slots=True)
 class PluginMetadata:
     """Plugin metadata for marketplace"""
     name: str
@@ -36,11 +37,21 @@ class PluginMetadata:
     pricing: str  # "free", "paid", "enterprise"
     
     def to_dict(self):
-        data = asdict(self)
-        data['category'] = self.category.value
-        return data
+        # Explicit literal instead of asdict(), which deep-copies every field via introspection.
+        # Lists are still copied because metadata instances are shared per plugin class.
+        return {
+            'name': self.name,
+            'version': self.version,
+            'author': self.author,
+            'description': self.description,
+            'category': self.category.value,
+            'documentation_url': self.documentation_url,
+            'icon_url': self.icon_url,
+            'tags': list(self.tags),
+            'pricing': self.pricing
+        }
 
-@dataclass
+@dataclass(slots=True)
 class ConfigField:
     """Configuration field definition"""
     name: str
@@ -54,7 +65,17 @@ class ConfigField:
     placeholder: Optional[str] = None
     
     def to_dict(self):
-        return asdict(self)
+        return {
+            'name': self.name,
+            'type': self.type,
+            'label': self.label,
+            'description': self.description,
+            'required': self.required,
+            'default': self.default,
+            'options': list(self.options) if self.options is not None else None,
+            'validation': self.validation,
+            'placeholder': self.placeholder
+        }
 
 class PluginRegistry:
     """Central registry for all plugins"""
@@ -62,6 +83,8 @@ class PluginRegistry:
     def __init__(self):
         self.plugins: Dict[str, Type] = {}
         self.plugin_metadata: Dict[str, PluginMetadata] = {}
+        # list_plugins() results per category; cleared whenever a plugin is registered
+        self._list_cache: Dict[Optional[PluginType], List[Dict]] = {}
         
     def register(self, plugin_class: Type) -> None:
         """Register a plugin class"""
@@ -73,6 +96,7 @@ class PluginRegistry:
             plugin_id = f"{metadata.category.value}:{metadata.name}"
             self.plugins[plugin_id] = plugin_class
             self.plugin_metadata[plugin_id] = metadata
+            self._list_cache.clear()
             
             logger.info(f"Registered plugin: {plugin_id}")
         except Exception as e:
@@ -83,7 +107,14 @@ class PluginRegistry:
         return self.plugins.get(plugin_id)
     
     def list_plugins(self, category: Optional[PluginType] = None) -> List[Dict]:
-        """List all registered plugins"""
+        """List all registered plugins (cached; callers must not mutate the result)"""
+        plugins = self._list_cache.get(category)
+        if plugins is None:
+            plugins = self._list_cache[category] = self._build_plugin_list(category)
+        return plugins
+    
+    def _build_plugin_list(self, category: Optional[PluginType]) -> List[Dict]:
+        """Build the list_plugins() result for one category"""
         plugins = []
         for plugin_id, metadata in self.plugin_metadata.items():
             if category is None or metadata.category == category:
@@ -92,8 +123,21 @@ class PluginRegistry:
                 plugins.append(plugin_info)
         return plugins
     
-    def auto_discover(self, plugin_dir: str = "plugins") -> None:
-        """Auto-discover and register plugins from directory"""
+    def auto_discover(self, plugin_dir: str = "plugins", scan_directory: bool = True) -> None:
+        """
+        Auto-discover and register plugins
+        Entry points in PLUGIN_ENTRY_POINT_GROUP are loaded first, then plugin_dir is
+        scanned when scan_directory is set; plugins from both sources are registered
+        """
+        self._discover_entry_points()
+        if not scan_directory:
+            return
+        
+        # Only needed for the directory scan, so not imported with the module
+        import importlib
+        import inspect
+        from pathlib import Path
+        
         plugin_path = Path(plugin_dir)
         if not plugin_path.exists():
             logger.warning(f"Plugin directory {plugin_dir} does not exist")
@@ -115,6 +159,16 @@ class PluginRegistry:
                         
             except Exception as e:
                 logger.error(f"Failed to import {py_file}: {e}")
+    
+    def _discover_entry_points(self) -> None:
+        """Register plugin classes declared as entry points"""
+        from importlib.metadata import entry_points
+        
+        for ep in entry_points(group=PLUGIN_ENTRY_POINT_GROUP):
+            try:
+                self.register(ep.load())
+            except Exception as e:
+                logger.error(f"Failed to load plugin entry point {ep.name}: {e}")
 
 class PluginManager:
     """Manages plugin instances and execution"""
@@ -194,7 +248,11 @@ class PluginManager:
         return instances
 
 class Pipeline:
-    """Data processing pipeline"""
+    """
+    Data processing pipeline
+    execute() runs inputs and outputs on a thread pool that lives until close(); call it
+    when the pipeline is discarded, or use the pipeline as a context manager
+    """
     
     def __init__(self, name: str, plugin_manager: PluginManager):
         self.name = name
@@ -203,6 +261,8 @@ class Pipeline:
         self.processing_instances: List[str] = []
         self.output_instances: List[str] = []
         self.enabled = True
+        # Created on first execute(), once the inputs and outputs are known
+        self._pool: Optional[ThreadPoolExecutor] = None
     
     def add_input(self, instance_id: str) -> None:
         """Add input plugin to pipeline"""
@@ -232,16 +292,29 @@ class Pipeline:
             return stats
         
         try:
-            # Collect from all inputs
-            all_events = []
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=max(4, len(self.input_instances) + len(self.output_instances)),
+                    thread_name_prefix=f"pipeline-{self.name}"
+                )
+            
+            # Collect from all inputs concurrently; results are read back in input order, and a
+            # failing input doesn't discard the events the others have already drained
+            collects = []
             for input_id in self.input_instances:
                 input_plugin = self.plugin_manager.get_instance(input_id)
                 if input_plugin:
-                    events = input_plugin.collect()
-                    all_events.extend(events)
-                    stats['events_collected'] += len(events)
+                    collects.append((input_id, self._pool.submit(input_plugin.collect)))
+            all_events = []
+            for input_id, future in collects:
+                try:
+                    all_events.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Pipeline {self.name} input {input_id} failed: {e}")
+                    stats['errors'].append(str(e))
+            stats['events_collected'] = len(all_events)
             
-            # Process events
+            # Process events (sequential: each processor consumes the previous one's output)
             processed_events = all_events
             for processor_id in self.processing_instances:
                 processor = self.plugin_manager.get_instance(processor_id)
@@ -250,14 +323,22 @@ class Pipeline:
             
             stats['events_processed'] = len(processed_events)
             
-            # Send to outputs
+            # Send to all outputs concurrently; a failing output doesn't hide the others' results
+            sends = []
             for output_id in self.output_instances:
-                output_plugin = self.plugin_manager.get_instance(output_id)
-                if output_plugin:
-                    result = output_plugin.send_batch(processed_events)
-                    stats['events_sent'] += result.get('success_count', 0)
-                    if result.get('errors'):
-                        stats['errors'].extend(result['errors'])
+                output = self.plugin_manager.get_instance(output_id)
+                if output:
+                    sends.append((output_id, self._pool.submit(output.send_batch, processed_events)))
+            for output_id, future in sends:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Pipeline {self.name} output {output_id} failed: {e}")
+                    stats['errors'].append(str(e))
+                    continue
+                stats['events_sent'] += result.get('success_count', 0)
+                if result.get('errors'):
+                    stats['errors'].extend(result['errors'])
             
         except Exception as e:
             logger.error(f"Pipeline {self.name} execution failed: {e}")
@@ -265,6 +346,18 @@ class Pipeline:
         
         return stats
     
+    def close(self) -> None:
+        """Shut down the worker threads used by execute()"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+    
+    def __enter__(self) -> 'Pipeline':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def to_dict(self) -> Dict[str, Any]:
         """Export pipeline configuration"""
         return {
@@ -4,152 +4,631 @@ Webhook Output Plugin
 Send logs to external HTTP endpoints
 """
 
-import sys
-sys.path.append('..')
-
 from plugin_manager import OutputPlugin, PluginMetadata, ConfigField, PluginType
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Mapping
+from types import MappingProxyType
+from urllib.parse import urlsplit
+from collections import deque
+import asyncio
+import http.client
+import importlib.util
+import json
+import logging
+import random
+import threading
 import time
 
+logger = logging.getLogger(__name__)
+
+# Optional fast JSON encoder; stdlib json is used when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional pooled HTTP client; http.client is used when it is not installed
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+# Optional async HTTP client used by the asend_* methods; they fall back to a worker thread without it
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx only enables HTTP/2 when h2 is installed; probed without importing it
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# health_check() results are reused for this many seconds, since orchestrators poll it frequently
+_HEALTH_CHECK_TTL = 1.0
+
+# Accepted URL prefixes for validate_config()
+_URL_SCHEMES = ('http://', 'https://')
+_SLACK_HOOK = 'https://hooks.slack.com/'
+
+# Slack attachment color per alert severity (read-only)
+_COLOR_MAP = MappingProxyType({
+    'critical': 'danger',
+    'warning': 'warning',
+    'info': 'good'
+})
+
+# Cloned for each attachment; copy() of the proxy returns a plain dict
+_ATTACHMENT_TEMPLATE = MappingProxyType({'color': None, 'text': None})
+
+# How long a sync send waits for a free bulkhead slot before failing fast
+_BULKHEAD_WAIT = 0.05
+
+# requests sessions shared by every target on the same (scheme, host, port), so all plugin
+# instances pointing at one host draw from a single keep-alive pool
+_SESSIONS: Dict[tuple, 'requests.Session'] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+def _get_session(host_key: tuple) -> 'requests.Session':
+    """Return the shared session for a host, creating it with a sized connection pool if needed"""
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(host_key)
+        if session is None:
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+            session = _SESSIONS[host_key] = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        return session
+
+# Retry policy: throttled/5xx responses and network errors are retried with full-jitter
+# exponential backoff; other 4xx responses (auth, validation) are returned straight away
+_RETRY_ERRORS = (OSError, http.client.HTTPException)
+_BACKOFF_BASE = 0.1
+_BACKOFF_CAP = 10.0
+
+def _should_retry(status: int) -> bool:
+    return status == 429 or status >= 500
+
+def _backoff(attempt: int) -> float:
+    """Delay before retrying after the given (0-based) attempt"""
+    return random.uniform(0, min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** attempt))
+
+# Errors meaning the server closed a kept-alive connection; the request is retried on a fresh one
+_STALE_CONNECTION_ERRORS = (http.client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a payload to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def _simulated_latency(config: Dict[str, Any]) -> Optional[float]:
+    """Seconds of fake latency when the hidden _simulate_latency option is on, else None (send for real)"""
+    if not config.get('_simulate_latency', False):
+        return None
+    return float(config.get('_simulate_latency_s', 0.0))
+
+def _new_async_client(timeout: float, headers: Mapping[str, str]) -> 'httpx.AsyncClient':
+    """Create an httpx client that multiplexes requests over HTTP/2 when h2 is installed"""
+    return httpx.AsyncClient(
+        http2=_HTTP2,
+        timeout=timeout,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=128),
+        headers=headers
+    )
+
+class _HTTPTarget:
+    """
+    Keep-alive HTTP(S) client for one URL
+    Uses the host's shared requests.Session when requests is installed, otherwise a persistent
+    http.client connection. The URL is parsed once, here. Retries are done by post()/apost().
+    """
+    
+    __slots__ = (
+        'url', 'scheme', 'host', 'path', 'method', 'headers', 'timeout', 'retries', 'breaker',
+        'simulated_latency', 'session', '_prepared', '_send_kwargs', '_conn', '_conn_lock'
+    )
+    
+    def __init__(self, url: str, method: str = 'POST', headers: Optional[Mapping[str, str]] = None,
+                 timeout: float = 30, retries: int = 3, simulated_latency: Optional[float] = None):
+        parts = urlsplit(url)
+        self.url = url
+        self.scheme = parts.scheme
+        self.host = (parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+        self.path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        self.method = method
+        self.headers = headers or MappingProxyType({'Content-Type': 'application/json'})
+        self.timeout = timeout
+        self.retries = retries
+        host_key = (self.scheme, *self.host)
+        self.breaker = _CircuitBreaker.for_host(host_key)
+        # Demo/load-test mode: when set, post() sleeps this long and reports success without any I/O
+        self.simulated_latency = simulated_latency
+        self.session = None
+        if requests is not None:
+            self.session = _get_session(host_key)
+            # URL, headers and proxy/TLS settings are resolved once; each post only swaps in the body
+            self._prepared = self.session.prepare_request(requests.Request(method, url, headers=dict(self.headers)))
+            self._send_kwargs = self.session.merge_environment_settings(url, {}, None, None, None)
+        # Opened on first request and kept alive (when requests is not installed)
+        self._conn = None
+        # Only one thread may use the http.client connection at a time
+        self._conn_lock = threading.Lock()
+    
+    def start_warm_up(self, name: str) -> None:
+        """Run warm_up() on a daemon thread when there is a connection to pre-open"""
+        # requests opens its pooled connections on first use, so only http.client is warmed up
+        if self.session is None and self.simulated_latency is None and self.host[0]:
+            threading.Thread(target=self.warm_up, name=name, daemon=True).start()
+    
+    def warm_up(self) -> None:
+        """Open the http.client connection (TCP and TLS handshake) ahead of the first post"""
+        try:
+            with self._conn_lock:
+                conn = self._get_conn()
+                if conn.sock is None:
+                    conn.connect()
+        except OSError:
+            # Not fatal: the first post connects (and reports the error) itself
+            pass
+    
+    def _get_conn(self) -> http.client.HTTPConnection:
+        """Return the persistent connection, opening it if needed"""
+        if self._conn is None:
+            conn_class = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+            self._conn = conn_class(*self.host, timeout=self.timeout)
+        return self._conn
+    
+    def post(self, body: bytes) -> int:
+        """Send one request body, retrying per the retry policy, and return the final HTTP status"""
+        if self.simulated_latency is not None:
+            if self.simulated_latency:
+                time.sleep(self.simulated_latency)
+            return 200
+        
+        for attempt in range(self.retries + 1):
+            # Give up early once the host's breaker has been tripped (possibly by another instance)
+            last = attempt == self.retries or self.breaker.state == 'open'
+            try:
+                status = self._send(body)
+            except _RETRY_ERRORS:
+                if last:
+                    raise
+            else:
+                if last or not _should_retry(status):
+                    return status
+            time.sleep(_backoff(attempt))
+    
+    async def apost(self, client: 'httpx.AsyncClient', body: bytes) -> int:
+        """Async post() over an httpx client"""
+        retry_errors = (*_RETRY_ERRORS, httpx.TransportError)
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries or self.breaker.state == 'open'
+            try:
+                status = (await client.request(self.method, self.url, content=body)).status_code
+            except retry_errors:
+                if last:
+                    raise
+            else:
+                if last or not _should_retry(status):
+                    return status
+            await asyncio.sleep(_backoff(attempt))
+    
+    def _send(self, body: bytes) -> int:
+        """Make a single request and return the HTTP status"""
+        if self.session is not None:
+            request = self._prepared.copy()
+            request.prepare_body(body, None)
+            return self.session.send(request, timeout=self.timeout, **self._send_kwargs).status_code
+        
+        with self._conn_lock:
+            for attempt in range(2):
+                conn = self._get_conn()
+                try:
+                    conn.request(self.method, self.path, body, self.headers)
+                    response = conn.getresponse()
+                    # Drain the body so the connection can be reused
+                    response.read()
+                    return response.status
+                except _STALE_CONNECTION_ERRORS:
+                    conn.close()
+                    self._conn = None
+                    if attempt:
+                        raise
+                except Exception:
+                    # Don't leave a half-used connection behind for the next request
+                    conn.close()
+                    self._conn = None
+                    raise
+    
+    def close(self) -> None:
+        """Close the persistent connection (the shared session stays open for other targets)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+class _CircuitBreaker:
+    """
+    Fail fast while an endpoint is down
+    Opens after THRESHOLD consecutive failures: transport errors, 5xx and 429, the same
+    responses _should_retry() retries. Other 4xx answers count as the host being up.
+    Once COOLDOWN seconds have passed a single probe request is let through (half-open);
+    its outcome closes or re-opens it.
+    A probe that never reports back is replaced by a new one after another COOLDOWN.
+    """
+    
+    __slots__ = ('state', 'fails', 'opened_at', 'probe_started', '_lock')
+    
+    THRESHOLD = 5
+    COOLDOWN = 30.0
+    
+    # One breaker per (scheme, host, port), shared by every plugin instance talking to that host
+    _registry: Dict[tuple, '_CircuitBreaker'] = {}
+    _registry_lock = threading.Lock()
+    
+    def __init__(self):
+        self.state = 'closed'
+        self.fails = 0
+        self.opened_at = 0.0
+        self.probe_started = 0.0
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def for_host(cls, key: tuple) -> '_CircuitBreaker':
+        with cls._registry_lock:
+            breaker = cls._registry.get(key)
+            if breaker is None:
+                breaker = cls._registry[key] = cls()
+            return breaker
+    
+    def allow(self) -> bool:
+        """Whether a request may be attempted now"""
+        if self.state == 'closed':
+            return True
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            now = time.monotonic()
+            since = now - (self.opened_at if self.state == 'open' else self.probe_started)
+            if since >= self.COOLDOWN:
+                self.state = 'half_open'
+                self.probe_started = now
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        if self.state != 'closed' or self.fails:
+            with self._lock:
+                self.state = 'closed'
+                self.fails = 0
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self.fails += 1
+            if self.state == 'half_open' or self.fails >= self.THRESHOLD:
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
 class WebhookOutputPlugin(OutputPlugin):
     """Send logs to HTTP webhook endpoint"""
     
-    @property
-    def metadata(self) -> PluginMetadata:
-        return PluginMetadata(
-            name="Webhook",
-            version="1.0.0",
-            author="AI/ML Observability Platform",
-            description="Send logs to any HTTP endpoint via POST requests. Supports custom headers, retry logic, and batching.",
-            category=PluginType.OUTPUT,
-            documentation_url="https://docs.aiml-obs.com/plugins/webhook",
-            icon_url="https://cdn.aiml-obs.com/icons/webhook.png",
-            tags=["webhook", "http", "api", "integration"],
-            pricing="free"
-        )
+    __slots__ = (
+        'config', 'success_count', 'error_count', '_hc_cache', '_hc_ts', '_target', '_breaker', '_client',
+        '_bulkhead', '_batch_size', '_flush_interval', '_buf', '_buf_lock', '_flush_evt', '_stopping', '_worker'
+    )
     
-    @property
-    def config_schema(self) -> List[ConfigField]:
-        return [
-            ConfigField(
-                name="url",
-                type="string",
-                label="Webhook URL",
-                description="Full URL of the webhook endpoint",
-                required=True,
-                placeholder="https://api.example.com/webhooks/logs"
-            ),
-            ConfigField(
-                name="method",
-                type="select",
-                label="HTTP Method",
-                description="HTTP method to use",
-                required=True,
-                default="POST",
-                options=["POST", "PUT", "PATCH"]
-            ),
-            ConfigField(
-                name="auth_header",
-                type="secret",
-                label="Authorization Header",
-                description="Value for Authorization header (e.g., 'Bearer token123')",
-                required=False,
-                placeholder="Bearer your-token-here"
-            ),
-            ConfigField(
-                name="custom_headers",
-                type="string",
-                label="Custom Headers (JSON)",
-                description='Additional headers as JSON object, e.g., {"X-Custom": "value"}',
-                required=False,
-                placeholder='{"X-API-Key": "value"}'
-            ),
-            ConfigField(
-                name="batch_size",
-                type="number",
-                label="Batch Size",
-                description="Number of logs to send in single request (1 = no batching)",
-                required=False,
-                default=100
-            ),
-            ConfigField(
-                name="timeout_seconds",
-                type="number",
-                label="Request Timeout (seconds)",
-                description="Maximum time to wait for response",
-                required=False,
-                default=30
-            ),
-            ConfigField(
-                name="retry_count",
-                type="number",
-                label="Retry Count",
-                description="Number of retries on failure",
-                required=False,
-                default=3
-            )
-        ]
+    # Built once at import and shared by every instance; treat as read-only
+    metadata = PluginMetadata(
+        name="Webhook",
+        version="1.0.0",
+        author="AI/ML Observability Platform",
+        description="Send logs to any HTTP endpoint via POST requests. Supports custom headers, retry logic, and batching.",
+        category=PluginType.OUTPUT,
+        documentation_url="https://docs.aiml-obs.com/plugins/webhook",
+        icon_url="https://cdn.aiml-obs.com/icons/webhook.png",
+        tags=["webhook", "http", "api", "integration"],
+        pricing="free"
+    )
+    
+    config_schema = [
+        ConfigField(
+            name="url",
+            type="string",
+            label="Webhook URL",
+            description="Full URL of the webhook endpoint",
+            required=True,
+            placeholder="https://api.example.com/webhooks/logs"
+        ),
+        ConfigField(
+            name="method",
+            type="select",
+            label="HTTP Method",
+            description="HTTP method to use",
+            required=True,
+            default="POST",
+            options=["POST", "PUT", "PATCH"]
+        ),
+        ConfigField(
+            name="auth_header",
+            type="secret",
+            label="Authorization Header",
+            description="Value for Authorization header (e.g., 'Bearer token123')",
+            required=False,
+            placeholder="Bearer your-token-here"
+        ),
+        ConfigField(
+            name="custom_headers",
+            type="string",
+            label="Custom Headers (JSON)",
+            description='Additional headers as JSON object, e.g., {"X-Custom": "value"}',
+            required=False,
+            placeholder='{"X-API-Key": "value"}'
+        ),
+        ConfigField(
+            name="batch_size",
+            type="number",
+            label="Batch Size",
+            description="Number of logs to send in single request (1 = no batching)",
+            required=False,
+            default=100
+        ),
+        ConfigField(
+            name="flush_interval_ms",
+            type="number",
+            label="Flush Interval (ms)",
+            description="Maximum time a log sent individually waits to be batched before it is flushed",
+            required=False,
+            default=1000
+        ),
+        ConfigField(
+            name="timeout_seconds",
+            type="number",
+            label="Request Timeout (seconds)",
+            description="Maximum time to wait for response",
+            required=False,
+            default=30
+        ),
+        ConfigField(
+            name="retry_count",
+            type="number",
+            label="Retry Count",
+            description="Number of retries on failure",
+            required=False,
+            default=3
+        ),
+        ConfigField(
+            name="max_concurrent",
+            type="number",
+            label="Max Concurrent Requests",
+            description="Requests allowed in flight at once; further sends fail fast instead of queueing behind a slow endpoint",
+            required=False,
+            default=16
+        )
+    ]
     
     def validate_config(self, config: Dict[str, Any]) -> tuple[bool, Optional[str]]:
-        url = config.get('url', '')
-        if not url.startswith(('http://', 'https://')):
+        if not config.get('url', '').startswith(_URL_SCHEMES):
             return False, "URL must start with http:// or https://"
         
-        batch_size = config.get('batch_size', 100)
-        if batch_size < 1 or batch_size > 10000:
+        if not 1 <= config.get('batch_size', 100) <= 10000:
             return False, "Batch size must be between 1 and 10000"
         
+        if config.get('flush_interval_ms', 1000) <= 0:
+            return False, "Flush interval must be greater than 0 ms"
+        
+        custom_headers = config.get('custom_headers')
+        if custom_headers:
+            # Accepted as a JSON string (from the config form) or an already-parsed dict
+            if isinstance(custom_headers, str):
+                try:
+                    custom_headers = json.loads(custom_headers)
+                except ValueError as e:
+                    return False, f"Custom headers are not valid JSON: {e}"
+            if not isinstance(custom_headers, dict) or not all(isinstance(v, str) for v in custom_headers.values()):
+                return False, "Custom headers must be a JSON object of string values"
+        
         return True, None
     
     def initialize(self, config: Dict[str, Any]) -> None:
         self.config = config
         self.success_count = 0
         self.error_count = 0
-        print(f"Webhook Output Plugin initialized for {config['url']}")
+        self._hc_cache = None
+        self._hc_ts = 0.0
+        # Build the headers once (custom_headers is only parsed here); every batch reuses them
+        headers = {'Content-Type': 'application/json'}
+        custom_headers = config.get('custom_headers')
+        if custom_headers:
+            headers.update(json.loads(custom_headers) if isinstance(custom_headers, str) else custom_headers)
+        if config.get('auth_header'):
+            headers['Authorization'] = config['auth_header']
+        self._target = _HTTPTarget(
+            config['url'],
+            method=config.get('method', 'POST'),
+            headers=MappingProxyType(headers),
+            timeout=config.get('timeout_seconds', 30),
+            retries=config.get('retry_count', 3),
+            simulated_latency=_simulated_latency(config)
+        )
+        self._breaker = self._target.breaker
+        # The TCP/TLS handshake happens in the background so the first batch doesn't wait on it
+        self._target.start_warm_up("webhook-warmup")
+        # Caps requests in flight so a slow endpoint can't tie up every caller thread
+        self._bulkhead = threading.BoundedSemaphore(config.get('max_concurrent', 16))
+        # Created on first asend_batch()
+        self._client = None
+        # send() buffers events here; a background thread flushes them in batches
+        self._batch_size = config.get('batch_size', 100)
+        self._flush_interval = config.get('flush_interval_ms', 1000) / 1000
+        self._buf = deque()
+        self._buf_lock = threading.Lock()
+        self._flush_evt = threading.Event()
+        self._stopping = False
+        # Started by the first send(); instances that only use send_batch() never need it
+        self._worker = None
+        logger.info("Webhook Output Plugin initialized for %s", config['url'])
+    
+    def close(self) -> None:
+        """Close the persistent connection"""
+        self._target.close()
+    
+    async def aclose(self) -> None:
+        """Close the async client and the sync connection"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self.close()
     
     def send(self, event: Dict[str, Any]) -> bool:
-        """Send single event"""
-        return self.send_batch([event])['success_count'] == 1
+        """
+        Queue single event
+        It is sent with the next batch, once batch_size events are waiting or
+        flush_interval_ms has passed; delivery failures show up in health_check().
+        Call finalize() before exiting: events still buffered then are lost otherwise
+        """
+        with self._buf_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._flush_loop, name="webhook-flush", daemon=True)
+                self._worker.start()
+            self._buf.append(event)
+            full = len(self._buf) >= self._batch_size
+        if full:
+            self._flush_evt.set()
+        return True
+    
+    def _flush_loop(self) -> None:
+        """Background thread: flush the send() buffer on size or interval"""
+        while not self._stopping:
+            self._flush_evt.wait(self._flush_interval)
+            self._flush_evt.clear()
+            self._flush()
+    
+    def _flush(self) -> None:
+        """Send everything currently buffered, batch_size events per request"""
+        while True:
+            with self._buf_lock:
+                popleft = self._buf.popleft
+                batch = [popleft() for _ in range(min(self._batch_size, len(self._buf)))]
+            if not batch:
+                return
+            self.send_batch(batch)
+    
+    def finalize(self) -> None:
+        """Stop the flush thread, send whatever is still buffered and close connections"""
+        self._stopping = True
+        self._flush_evt.set()
+        if self._worker is not None:
+            self._worker.join()
+        self._flush()
+        self.close()
     
     def send_batch(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Send batch of events"""
-        # In real implementation, make HTTP request
-        # For demo, simulate success
+        n = len(events)
+        breaker = self._breaker
+        target = self._target
+        # Take a bulkhead slot before asking the breaker: allow() may hand out the host's only
+        # half-open probe, which must then be reported back, not dropped on a full bulkhead
+        if not self._bulkhead.acquire(timeout=_BULKHEAD_WAIT):
+            return self._batch_failed(n, "Too many webhook requests in flight")
+        
         try:
-            # Simulate HTTP request
-            time.sleep(0.01)  # Simulate network latency
-            
-            self.success_count += len(events)
-            
-            return {
-                'success_count': len(events),
-                'failed_count': 0,
-                'errors': []
-            }
+            if not breaker.allow():
+                return self._batch_failed(n, f"Circuit open for {target.host[0]}")
+            status = target.post(_dumps(events))
+            if status >= 400:
+                if _should_retry(status):
+                    raise http.client.HTTPException(f"Webhook returned HTTP {status}")
+                # The host answered; a rejected request (revoked or misconfigured URL) says
+                # nothing about its health, so it must not trip the breaker other instances share
+                breaker.record_success()
+                return self._batch_failed(n, f"Webhook returned HTTP {status}")
         except Exception as e:
-            self.error_count += len(events)
-            return {
-                'success_count': 0,
-                'failed_count': len(events),
-                'errors': [str(e)]
-            }
+            breaker.record_failure()
+            return self._batch_failed(n, e)
+        except BaseException:
+            # Cancelled or interrupted mid-request: still report it, or a probe would never finish
+            breaker.record_failure()
+            raise
+        finally:
+            self._bulkhead.release()
+        breaker.record_success()
+        return self._batch_succeeded(n)
+    
+    async def asend_batch(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send batch of events without blocking the event loop"""
+        if httpx is None or self._target.simulated_latency is not None:
+            return await asyncio.to_thread(self.send_batch, events)
+        
+        n = len(events)
+        breaker = self._breaker
+        target = self._target
+        # Never wait for a slot here: that would block the event loop. The slot is taken
+        # before allow() for the same reason as in send_batch()
+        if not self._bulkhead.acquire(blocking=False):
+            return self._batch_failed(n, "Too many webhook requests in flight")
+        
+        try:
+            if not breaker.allow():
+                return self._batch_failed(n, f"Circuit open for {target.host[0]}")
+            if self._client is None:
+                self._client = _new_async_client(target.timeout, target.headers)
+            status = await target.apost(self._client, _dumps(events))
+            if status >= 400:
+                if _should_retry(status):
+                    raise http.client.HTTPException(f"Webhook returned HTTP {status}")
+                # The host answered; a rejected request (revoked or misconfigured URL) says
+                # nothing about its health, so it must not trip the breaker other instances share
+                breaker.record_success()
+                return self._batch_failed(n, f"Webhook returned HTTP {status}")
+        except Exception as e:
+            breaker.record_failure()
+            return self._batch_failed(n, e)
+        except BaseException:
+            # Cancelled or interrupted mid-request: still report it, or a probe would never finish
+            breaker.record_failure()
+            raise
+        finally:
+            self._bulkhead.release()
+        breaker.record_success()
+        return self._batch_succeeded(n)
+    
+    def _batch_succeeded(self, count: int) -> Dict[str, Any]:
+        self.success_count += count
+        return {
+            'success_count': count,
+            'failed_count': 0,
+            'errors': []
+        }
+    
+    def _batch_failed(self, count: int, error: Any) -> Dict[str, Any]:
+        self.error_count += count
+        return {
+            'success_count': 0,
+            'failed_count': count,
+            'errors': [str(error)]
+        }
     
     def health_check(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        if self._hc_cache is not None and now - self._hc_ts < _HEALTH_CHECK_TTL:
+            return self._hc_cache
+        
         total = self.success_count + self.error_count
         success_rate = (self.success_count / total * 100) if total > 0 else 100
         
         status = "healthy" if success_rate > 95 else ("degraded" if success_rate > 50 else "unhealthy")
         
-        return {
+        self._hc_cache, self._hc_ts = {
             "status": status,
             "message": f"Success rate: {success_rate:.1f}%",
             "metrics": {
                 "success_count": self.success_count,
                 "error_count": self.error_count,
                 "success_rate": success_rate,
-                "endpoint": self.config['url']
+                "endpoint": self.config['url'],
+                "circuit": self._breaker.state
             }
-        }
+        }, now
+        return self._hc_cache
 
 
 # plugins/slack_alert.py
@@ -163,78 +642,87 @@ from plugin_manager import AlertPlugin, PluginMetadata, ConfigField, PluginType
 class SlackAlertPlugin(AlertPlugin):
     """Send alerts to Slack channels"""
     
-    @property
-    def metadata(self) -> PluginMetadata:
-        return PluginMetadata(
-            name="Slack Notifications",
-            version="1.0.0",
-            author="AI/ML Observability Platform",
-            description="Send alert notifications to Slack channels using webhooks. Supports rich formatting, mentions, and custom colors.",
-            category=PluginType.ALERT,
-            documentation_url="https://docs.aiml-obs.com/plugins/slack",
-            icon_url="https://cdn.aiml-obs.com/icons/slack.png",
-            tags=["slack", "alerts", "notifications", "chat"],
-            pricing="free"
-        )
+    __slots__ = (
+        'config', 'alerts_sent', '_hc_cache', '_hc_ts', '_target', '_breaker',
+        '_bulkhead', '_base_msg', '_mentions', '_use_colors', '_client'
+    )
     
-    @property
-    def config_schema(self) -> List[ConfigField]:
-        return [
-            ConfigField(
-                name="webhook_url",
-                type="secret",
-                label="Slack Webhook URL",
-                description="Incoming webhook URL from Slack workspace",
-                required=True,
-                placeholder="https://hooks.slack.com/services/XXX/YYY/ZZZ"
-            ),
-            ConfigField(
-                name="channel",
-                type="string",
-                label="Default Channel",
-                description="Channel to send alerts to (optional, webhook determines default)",
-                required=False,
-                placeholder="#alerts"
-            ),
-            ConfigField(
-                name="username",
-                type="string",
-                label="Bot Username",
-                description="Display name for the bot",
-                required=False,
-                default="AI/ML Observability",
-                placeholder="AI/ML Observability"
-            ),
-            ConfigField(
-                name="icon_emoji",
-                type="string",
-                label="Bot Icon Emoji",
-                description="Emoji to use as bot avatar",
-                required=False,
-                default=":robot_face:",
-                placeholder=":robot_face:"
-            ),
-            ConfigField(
-                name="mention_users",
-                type="string",
-                label="Mention Users",
-                description="Comma-separated list of users to @mention on critical alerts",
-                required=False,
-                placeholder="@user1, @user2"
-            ),
-            ConfigField(
-                name="severity_colors",
-                type="boolean",
-                label="Use Severity Colors",
-                description="Color-code messages by severity (red=critical, yellow=warning, green=info)",
-                required=False,
-                default=True
-            )
-        ]
+    # Built once at import and shared by every instance; treat as read-only
+    metadata = PluginMetadata(
+        name="Slack Notifications",
+        version="1.0.0",
+        author="AI/ML Observability Platform",
+        description="Send alert notifications to Slack channels using webhooks. Supports rich formatting, mentions, and custom colors.",
+        category=PluginType.ALERT,
+        documentation_url="https://docs.aiml-obs.com/plugins/slack",
+        icon_url="https://cdn.aiml-obs.com/icons/slack.png",
+        tags=["slack", "alerts", "notifications", "chat"],
+        pricing="free"
+    )
+    
+    config_schema = [
+        ConfigField(
+            name="webhook_url",
+            type="secret",
+            label="Slack Webhook URL",
+            description="Incoming webhook URL from Slack workspace",
+            required=True,
+            placeholder="https://hooks.slack.com/services/XXX/YYY/ZZZ"
+        ),
+        ConfigField(
+            name="channel",
+            type="string",
+            label="Default Channel",
+            description="Channel to send alerts to (optional, webhook determines default)",
+            required=False,
+            placeholder="#alerts"
+        ),
+        ConfigField(
+            name="username",
+            type="string",
+            label="Bot Username",
+            description="Display name for the bot",
+            required=False,
+            default="AI/ML Observability",
+            placeholder="AI/ML Observability"
+        ),
+        ConfigField(
+            name="icon_emoji",
+            type="string",
+            label="Bot Icon Emoji",
+            description="Emoji to use as bot avatar",
+            required=False,
+            default=":robot_face:",
+            placeholder=":robot_face:"
+        ),
+        ConfigField(
+            name="mention_users",
+            type="string",
+            label="Mention Users",
+            description="Comma-separated list of users to @mention on critical alerts",
+            required=False,
+            placeholder="@user1, @user2"
+        ),
+        ConfigField(
+            name="severity_colors",
+            type="boolean",
+            label="Use Severity Colors",
+            description="Color-code messages by severity (red=critical, yellow=warning, green=info)",
+            required=False,
+            default=True
+        ),
+        ConfigField(
+            name="max_concurrent",
+            type="number",
+            label="Max Concurrent Requests",
+            description="Requests allowed in flight at once; further sends fail fast instead of queueing behind a slow endpoint",
+            required=False,
+            default=16
+        )
+    ]
     
     def validate_config(self, config: Dict[str, Any]) -> tuple[bool, Optional[str]]:
-        webhook_url = config.get('webhook_url', '')
-        if not webhook_url.startswith('https://hooks.slack.com/'):
+        if not config.get('webhook_url', '').startswith(_SLACK_HOOK):
             return False, "Invalid Slack webhook URL format"
         
         return True, None
@@ -242,58 +730,144 @@ class SlackAlertPlugin(AlertPlugin):
     def initialize(self, config: Dict[str, Any]) -> None:
         self.config = config
         self.alerts_sent = 0
-        print(f"Slack Alert Plugin initialized for {config.get('channel', 'default channel')}")
+        self._hc_cache = None
+        self._hc_ts = 0.0
+        self._target = _HTTPTarget(config.get('webhook_url', ''), timeout=10, simulated_latency=_simulated_latency(config))
+        self._breaker = self._target.breaker
+        self._target.start_warm_up("slack-warmup")
+        self._bulkhead = threading.BoundedSemaphore(config.get('max_concurrent', 16))
+        # Parts of the payload that are the same for every alert
+        self._base_msg = {
+            'username': config.get('username', 'AI/ML Observability'),
+            'icon_emoji': config.get('icon_emoji', ':robot_face:')
+        }
+        self._mentions = config.get('mention_users', '')
+        self._use_colors = bool(config.get('severity_colors', True))
+        # Created on first asend_alert()
+        self._client = None
+        logger.info("Slack Alert Plugin initialized for %s", config.get('channel', 'default channel'))
+    
+    def _build_message(self, alert: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the Slack webhook payload for an alert"""
+        severity = alert.get('severity', 'info')
+        title = alert.get('title', 'Alert')
+        message = alert.get('message', '')
+        
+        # Build Slack message
+        slack_message = {**self._base_msg, 'text': f"*{title}*\n{message}"}
+        
+        # Add color based on severity
+        if self._use_colors:
+            attachment = _ATTACHMENT_TEMPLATE.copy()
+            attachment['color'] = _COLOR_MAP.get(severity, 'good')
+            attachment['text'] = message
+            slack_message['attachments'] = (attachment,)
+        
+        # Add mentions for critical alerts
+        if severity == 'critical' and self._mentions:
+            slack_message['text'] = f"{self._mentions}\n{slack_message['text']}"
+        
+        return slack_message
     
     def send_alert(self, alert: Dict[str, Any]) -> bool:
         """Send alert to Slack"""
+        breaker = self._breaker
+        # Slot first, then breaker, so a half-open probe is never handed out and then dropped
+        if not self._bulkhead.acquire(timeout=_BULKHEAD_WAIT):
+            logger.warning("Failed to send Slack alert: too many requests in flight")
+            return False
+        
         try:
-            # In real implementation, send to Slack webhook
-            # For demo, simulate success
+            if not breaker.allow():
+                return False
+            status = self._target.post(_dumps(self._build_message(alert)))
+            if status >= 400:
+                if _should_retry(status):
+                    raise http.client.HTTPException(f"Slack returned HTTP {status}")
+                # A rejected webhook only fails this alert: every Slack webhook shares the
+                # hooks.slack.com breaker, which tracks the host's health, not the URL's
+                breaker.record_success()
+                logger.warning(f"Failed to send Slack alert: Slack returned HTTP {status}")
+                return False
             
-            severity = alert.get('severity', 'info')
-            title = alert.get('title', 'Alert')
-            message = alert.get('message', '')
-            
-            # Build Slack message
-            slack_message = {
-                'username': self.config.get('username', 'AI/ML Observability'),
-                'icon_emoji': self.config.get('icon_emoji', ':robot_face:'),
-                'text': f"*{title}*\n{message}"
-            }
-            
-            # Add color based on severity
-            if self.config.get('severity_colors', True):
-                color_map = {
-                    'critical': 'danger',
-                    'warning': 'warning',
-                    'info': 'good'
-                }
-                slack_message['attachments'] = [{
-                    'color': color_map.get(severity, 'good'),
-                    'text': message
-                }]
-            
-            # Add mentions for critical alerts
-            if severity == 'critical' and self.config.get('mention_users'):
-                mentions = self.config['mention_users']
-                slack_message['text'] = f"{mentions}\n{slack_message['text']}"
+            breaker.record_success()
+            self.alerts_sent += 1
+            return True
             
-            # Simulate sending (in real implementation, use requests.post)
-            time.sleep(0.01)
+        except Exception:
+            breaker.record_failure()
+            logger.exception("Failed to send Slack alert")
+            return False
+        except BaseException:
+            # Cancelled or interrupted mid-request: still report it, or a probe would never finish
+            breaker.record_failure()
+            raise
+        finally:
+            self._bulkhead.release()
+    
+    async def asend_alert(self, alert: Dict[str, Any]) -> bool:
+        """Send alert to Slack without blocking the event loop"""
+        if httpx is None or self._target.simulated_latency is not None:
+            return await asyncio.to_thread(self.send_alert, alert)
+        
+        breaker = self._breaker
+        if not self._bulkhead.acquire(blocking=False):
+            logger.warning("Failed to send Slack alert: too many requests in flight")
+            return False
+        
+        try:
+            if not breaker.allow():
+                return False
+            target = self._target
+            if self._client is None:
+                self._client = _new_async_client(target.timeout, target.headers)
+            status = await target.apost(self._client, _dumps(self._build_message(alert)))
+            if status >= 400:
+                if _should_retry(status):
+                    raise http.client.HTTPException(f"Slack returned HTTP {status}")
+                # A rejected webhook only fails this alert: every Slack webhook shares the
+                # hooks.slack.com breaker, which tracks the host's health, not the URL's
+                breaker.record_success()
+                logger.warning(f"Failed to send Slack alert: Slack returned HTTP {status}")
+                return False
             
+            breaker.record_success()
             self.alerts_sent += 1
             return True
             
-        except Exception as e:
-            print(f"Failed to send Slack alert: {e}")
+        except Exception:
+            breaker.record_failure()
+            logger.exception("Failed to send Slack alert")
             return False
+        except BaseException:
+            # Cancelled or interrupted mid-request: still report it, or a probe would never finish
+            breaker.record_failure()
+            raise
+        finally:
+            self._bulkhead.release()
+    
+    def close(self) -> None:
+        """Close the persistent connection"""
+        self._target.close()
+    
+    async def aclose(self) -> None:
+        """Close the async client and the sync connection"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self.close()
     
     def health_check(self) -> Dict[str, Any]:
-        return {
+        now = time.monotonic()
+        if self._hc_cache is not None and now - self._hc_ts < _HEALTH_CHECK_TTL:
+            return self._hc_cache
+        
+        self._hc_cache, self._hc_ts = {
             "status": "healthy",
             "message": f"Slack alerts configured for {self.config.get('channel', 'default channel')}",
             "metrics": {
                 "alerts_sent": self.alerts_sent,
                 "webhook_configured": bool(self.config.get('webhook_url'))
             }
-        }
+        }, now
+        return self._hc_cache
@@ -13,7 +13,6 @@ import streamlit as st
 try:
     import auth
     import login_ui
-    import admin_panel
     
     # Initialize Firebase and session state
     auth.init_firebase()
@@ -31,13 +30,15 @@ try:
     
     # Admin panel access (only for admin users)
     if auth.is_admin():
-        st.sidebar.markdown("---")
+        st.sidebar.divider()
         st.sidebar.markdown("### 🔧 Admin Controls")
         if st.sidebar.button("👤 Manage Users", use_container_width=True, type="primary"):
             st.session_state.show_admin_panel = True
     
     # Show admin panel if requested
     if st.session_state.get('show_admin_panel', False):
+        # Only admins ever reach this branch, so the module is imported on first use
+        import admin_panel
         admin_panel.show_admin_panel()
         
         if st.button("← Back to Dashboard"):
@@ -66,15 +67,24 @@ except ImportError as e:
 # Your original dashboard code starts below
 # ============================================================
 
-import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType
+from collections import namedtuple
 import random
 import time
 import json
+import os
+import hashlib
+import tempfile
+import threading
+
+# st.fragment reruns a single function instead of the whole script; it is not available
+# in older Streamlit releases, which fall back to a full rerun
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
 
 # Page configuration
 st.set_page_config(
@@ -85,234 +95,70 @@ st.set_page_config(
 )
 
 # Custom CSS for professional styling with centered navigation
-st.markdown("""
-<style>
-    /* Professional sidebar styling */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #0f172a 0%, #1e293b 100%);
-    }
-    
-    [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] {
-        color: #e2e8f0;
-    }
-    
-    /* Center navigation items */
-    [data-testid="stSidebar"] .stRadio > div {
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        gap: 0.5rem;
-    }
-    
-    [data-testid="stSidebar"] .stRadio > label {
-        display: flex;
-        justify-content: center;
-        font-weight: 600;
-        font-size: 1.1rem;
-        color: #60a5fa;
-        margin-bottom: 0.5rem;
-    }
-    
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] {
-        gap: 0.75rem;
-    }
-    
-    [data-testid="stSidebar"] .stRadio label {
-        background: rgba(30, 64, 175, 0.1);
-        padding: 0.75rem 1.5rem;
-        border-radius: 8px;
-        border: 2px solid transparent;
-        transition: all 0.3s ease;
-        cursor: pointer;
-        width: 100%;
-        text-align: center;
-        font-size: 0.95rem;
-    }
-    
-    [data-testid="stSidebar"] .stRadio label:hover {
-        background: rgba(59, 130, 246, 0.2);
-        border-color: #3b82f6;
-        transform: translateX(5px);
-    }
-    
-    [data-testid="stSidebar"] .stRadio label[data-checked="true"] {
-        background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%);
-        border-color: #60a5fa;
-        color: white;
-        box-shadow: 0 4px 15px rgba(59, 130, 246, 0.4);
-    }
-    
-    /* Main content styling */
-    .main-header {
-        font-size: 2.8rem;
-        font-weight: 800;
-        background: linear-gradient(135deg, #1e40af 0%, #8b5cf6 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 0.5rem;
-        letter-spacing: -0.02em;
-    }
-    
-    .sub-header {
-        font-size: 1.1rem;
-        color: #6b7280;
-        text-align: center;
-        margin-bottom: 2rem;
-        font-weight: 500;
-    }
-    
-    /* Help bubble styling */
-    .help-bubble {
-        position: relative;
-        display: inline-block;
-        background: linear-gradient(135deg, #3b82f6 0%, #8b5cf6 100%);
-        color: white;
-        padding: 0.75rem 1.25rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        box-shadow: 0 4px 15px rgba(59, 130, 246, 0.3);
-        animation: pulse 2s infinite;
-    }
-    
-    .help-bubble::before {
-        content: "💡";
-        margin-right: 0.5rem;
-        font-size: 1.2rem;
-    }
-    
-    @keyframes pulse {
-        0%, 100% { box-shadow: 0 4px 15px rgba(59, 130, 246, 0.3); }
-        50% { box-shadow: 0 6px 25px rgba(59, 130, 246, 0.5); }
-    }
-    
-    .info-card {
-        background: linear-gradient(135deg, #eff6ff 0%, #dbeafe 100%);
-        border-left: 4px solid #3b82f6;
-        padding: 1rem 1.5rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-    }
-    
-    .info-card-title {
-        font-weight: 700;
-        color: #1e40af;
-        font-size: 1rem;
-        margin-bottom: 0.5rem;
-    }
-    
-    .info-card-content {
-        color: #1e3a8a;
-        font-size: 0.9rem;
-        line-height: 1.6;
-    }
-    
-    /* Metric cards */
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1.5rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-    }
-    
-    /* Status boxes */
-    .success-box {
-        background-color: #d1fae5;
-        border-left: 5px solid #10b981;
-        padding: 1rem;
-        border-radius: 5px;
-        margin: 1rem 0;
-    }
-    
-    .warning-box {
-        background-color: #fef3c7;
-        border-left: 5px solid #f59e0b;
-        padding: 1rem;
-        border-radius: 5px;
-        margin: 1rem 0;
-    }
-    
-    .error-box {
-        background-color: #fee2e2;
-        border-left: 5px solid #ef4444;
-        padding: 1rem;
-        border-radius: 5px;
-        margin: 1rem 0;
-    }
-    
-    /* Tabs styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 1rem;
-        background-color: #f9fafb;
-        padding: 0.5rem;
-        border-radius: 8px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        height: 3rem;
-        padding: 0 2rem;
-        background-color: white;
-        border-radius: 6px;
-        border: 2px solid #e5e7eb;
-        font-weight: 600;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%);
-        color: white;
-        border-color: #3b82f6;
-        box-shadow: 0 4px 10px rgba(59, 130, 246, 0.3);
-    }
-    
-    /* Sidebar metrics styling */
-    [data-testid="stSidebar"] .stMetric {
-        background: rgba(59, 130, 246, 0.1);
-        padding: 0.75rem;
-        border-radius: 8px;
-        border: 1px solid rgba(96, 165, 250, 0.2);
-    }
-    
-    [data-testid="stSidebar"] .stMetric label {
-        color: #94a3b8 !important;
-        font-size: 0.85rem;
-    }
-    
-    [data-testid="stSidebar"] .stMetric [data-testid="stMetricValue"] {
-        color: #60a5fa !important;
-        font-size: 1.5rem;
-    }
-    
-    /* Tour highlight */
-    .tour-highlight {
-        animation: highlight 2s ease-in-out infinite;
-        border: 2px solid #fbbf24;
-        border-radius: 8px;
-        padding: 1rem;
-    }
-    
-    @keyframes highlight {
-        0%, 100% { box-shadow: 0 0 10px rgba(251, 191, 36, 0.5); }
-        50% { box-shadow: 0 0 20px rgba(251, 191, 36, 0.8); }
-    }
-    
-    /* Tooltip styling */
-    .tooltip-icon {
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        width: 20px;
-        height: 20px;
-        background: #3b82f6;
-        color: white;
-        border-radius: 50%;
-        font-size: 0.75rem;
-        font-weight: bold;
-        cursor: help;
-        margin-left: 0.5rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css():
+    """Read the portal stylesheet once per server process instead of on every rerun"""
+    return Path(__file__).parent.joinpath("portal.css").read_text(encoding="utf-8")
+
+# Minimal UI only adds overrides to the same <style> element. The sheet has to be sent on
+# every rerun: Streamlit drops any element the script doesn't emit again, so a
+# once-per-session guard would leave later reruns unstyled
+MINIMAL_UI_CSS = ".help-bubble, .tour-highlight { animation: none; }"
+
+st.markdown(
+    f"<style>{load_css()}{MINIMAL_UI_CSS if st.session_state.get('minimal_ui') else ''}</style>",
+    unsafe_allow_html=True
+)
+
+# Simulator state persisted between sessions, one file per signed-in user
+STATE_DIR = Path.home() / ".aiml-portal"
+
+# Captured logs kept in the session and on disk; older logs are dropped first
+MAX_LOG_HISTORY = 500
+
+def state_file():
+    """State file of the signed-in user, or None when there is no user to key it by"""
+    uid = (st.session_state.get('user') or {}).get('uid')
+    if not uid:
+        return None
+    return STATE_DIR / f"state-{hashlib.sha256(uid.encode('utf-8')).hexdigest()[:16]}.json"
+
+@st.cache_resource
+def state_lock():
+    """Serializes state updates from concurrent sessions of the same server process"""
+    return threading.Lock()
+
+@st.cache_resource
+def load_state(path):
+    """Read one state file once per server process; later writes go through save_state()"""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def save_state(key, value):
+    """Update one key of the user's persisted state and write it back to disk"""
+    path = state_file()
+    if path is None:
+        return
+    with state_lock():
+        state = load_state(path)
+        state[key] = value
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Written to a temporary file and renamed over the old one, so a crash or a
+            # concurrent reader never sees a half-written file
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.stem, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                    tmp.write(json.dumps(state))
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            # Persistence is best effort; the in-memory session state is still correct
+            pass
 
 # Initialize session state
 if 'log_count' not in st.session_state:
@@ -321,41 +167,57 @@ if 'alert_count' not in st.session_state:
     st.session_state.alert_count = 0
 if 'total_cost' not in st.session_state:
     st.session_state.total_cost = 0.0
-if 'ingestion_active' not in st.session_state:
-    st.session_state.ingestion_active = False
 if 'log_history' not in st.session_state:
-    st.session_state.log_history = []
+    # Seeded from disk so captured logs survive a browser refresh or server restart
+    _state_path = state_file()
+    _saved = load_state(_state_path).get('log_history', []) if _state_path is not None else []
+    st.session_state.log_history = list(_saved[-MAX_LOG_HISTORY:])
+if 'log_version' not in st.session_state:
+    # Bumped on every capture or clear; the Quick Stats deltas are rebuilt when it changes
+    st.session_state.log_version = 0
 if 'show_help' not in st.session_state:
     st.session_state.show_help = True
-if 'tour_step' not in st.session_state:
-    st.session_state.tour_step = 0
-if 'sample_logs_generated' not in st.session_state:
-    st.session_state.sample_logs_generated = False
+if 'minimal_ui' not in st.session_state:
+    st.session_state.minimal_ui = False
+
+# Value pools for the generated logs, shared by the generators and the pages instead of
+# rebuilding the same lists on every call
+MODEL_NAMES = ("GPT-4", "Claude-3", "Llama-2", "Gemini-Pro", "Mistral-7B")
+USER_IDS = ("user_001", "user_002", "user_003", "data_science_team", "ml_ops_team")
+PIPELINE_STAGES = ("ingestion", "embedding", "retrieval", "inference", "post-processing")
+LOG_STATUSES = ("success", "success", "success", "warning", "error")
 
 # Data generation functions
 def generate_log_entry():
     """Generate realistic log entry"""
-    models = ["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro", "Mistral-7B"]
-    stages = ["ingestion", "embedding", "retrieval", "inference", "post-processing"]
-    users = ["user_001", "user_002", "user_003", "data_science_team", "ml_ops_team"]
-    
     trace_id = f"{random.randint(1000, 9999)}-{random.randint(1000, 9999)}-{random.randint(1000, 9999)}"
     
     log = {
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+        "timestamp": datetime.now().isoformat(sep=" ", timespec="milliseconds"),
         "trace_id": trace_id,
-        "model": random.choice(models),
-        "stage": random.choice(stages),
-        "user_id": random.choice(users),
+        "model": random.choice(MODEL_NAMES),
+        "stage": random.choice(PIPELINE_STAGES),
+        "user_id": random.choice(USER_IDS),
         "latency_ms": random.randint(50, 3000),
         "tokens_input": random.randint(100, 2000),
         "tokens_output": random.randint(50, 1000),
         "confidence_score": round(random.uniform(0.6, 0.99), 2),
         "cost_usd": round(random.uniform(0.001, 0.05), 4),
-        "status": random.choice(["success", "success", "success", "warning", "error"])
+        "status": random.choice(LOG_STATUSES)
     }
     return log
 
+# Static description of each RAG stage: latency range and start offset from the trace start
+RagStage = namedtuple('RagStage', 'stage service min_ms max_ms offset_ms')
+RAG_CHAIN_STAGES = (
+    RagStage("Ingestion", "document-processor", 10, 50, 0),
+    RagStage("Embedding", "embedding-service", 100, 200, 50),
+    RagStage("Retrieval", "vector-db", 30, 80, 250),
+    RagStage("Prompt Construction", "prompt-builder", 5, 15, 330),
+    RagStage("LLM Inference", "llm-gateway", 1500, 2500, 345),
+    RagStage("Post-Processing", "response-formatter", 10, 30, 2845)
+)
+
 def generate_rag_chain():
     """Generate complete RAG execution chain"""
     trace_id = f"rag-{random.randint(1000, 9999)}"
@@ -363,55 +225,32 @@ def generate_rag_chain():
     
     chain = [
         {
-            "stage": "Ingestion",
-            "service": "document-processor",
-            "latency_ms": random.randint(10, 50),
-            "status": "success",
-            "timestamp": base_time.strftime("%H:%M:%S.%f")[:-3]
-        },
-        {
-            "stage": "Embedding",
-            "service": "embedding-service",
-            "latency_ms": random.randint(100, 200),
-            "status": "success",
-            "timestamp": (base_time + timedelta(milliseconds=50)).strftime("%H:%M:%S.%f")[:-3]
-        },
-        {
-            "stage": "Retrieval",
-            "service": "vector-db",
-            "latency_ms": random.randint(30, 80),
-            "status": "success",
-            "timestamp": (base_time + timedelta(milliseconds=250)).strftime("%H:%M:%S.%f")[:-3]
-        },
-        {
-            "stage": "Prompt Construction",
-            "service": "prompt-builder",
-            "latency_ms": random.randint(5, 15),
-            "status": "success",
-            "timestamp": (base_time + timedelta(milliseconds=330)).strftime("%H:%M:%S.%f")[:-3]
-        },
-        {
-            "stage": "LLM Inference",
-            "service": "llm-gateway",
-            "latency_ms": random.randint(1500, 2500),
-            "status": "success",
-            "timestamp": (base_time + timedelta(milliseconds=345)).strftime("%H:%M:%S.%f")[:-3]
-        },
-        {
-            "stage": "Post-Processing",
-            "service": "response-formatter",
-            "latency_ms": random.randint(10, 30),
+            "stage": spec.stage,
+            "service": spec.service,
+            "latency_ms": random.randint(spec.min_ms, spec.max_ms),
             "status": "success",
-            "timestamp": (base_time + timedelta(milliseconds=2845)).strftime("%H:%M:%S.%f")[:-3]
+            "timestamp": (base_time + timedelta(milliseconds=spec.offset_ms)).time().isoformat(timespec="milliseconds")
         }
+        for spec in RAG_CHAIN_STAGES
     ]
     
     return trace_id, chain
+
+# Read-only lookup tables shared by the generators and the pages
+SOURCE_CATEGORIES = (
+    "🤖 AI/ML Applications",
+    "🔗 RAG Pipeline",
+    "📊 Model Metrics",
+    "👥 User Interactions",
+    "🖥️ Infrastructure",
+    "🔒 Governance & Compliance"
+)
+
 def generate_source_specific_log(source_category):
     """Generate logs specific to each of the six source categories"""
     
     trace_id = f"{random.randint(1000, 9999)}-{random.randint(1000, 9999)}-{random.randint(1000, 9999)}"
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+    timestamp = datetime.now().isoformat(sep=" ", timespec="milliseconds")
     
     if source_category == "🤖 AI/ML Applications":
         log = {
@@ -419,7 +258,7 @@ def generate_source_specific_log(source_category):
             "source_category": "AI/ML Applications",
             "source_type": random.choice(["model_serving", "training_job", "data_pipeline", "inference_api"]),
             "trace_id": trace_id,
-            "model": random.choice(["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro", "Mistral-7B"]),
+            "model": random.choice(MODEL_NAMES),
             "operation": random.choice(["inference", "batch_prediction", "online_serving"]),
             "latency_ms": random.randint(50, 3000),
             "tokens_input": random.randint(100, 2000),
@@ -467,7 +306,7 @@ def generate_source_specific_log(source_category):
             "timestamp": timestamp,
             "source_category": "User Interactions",
             "trace_id": trace_id,
-            "user_id": random.choice(["user_001", "user_002", "user_003", "data_science_team", "ml_ops_team"]),
+            "user_id": random.choice(USER_IDS),
             "action": random.choice(["login", "query", "config_change", "data_access", "model_deploy", "dashboard_view"]),
             "session_id": f"sess_{random.randint(10000, 99999)}",
             "ip_address": f"192.168.{random.randint(1, 255)}.{random.randint(1, 255)}",
@@ -512,22 +351,365 @@ def generate_source_specific_log(source_category):
     return log
 
 
+# Markup for the help widgets, kept on one line so st.markdown has no indentation to strip
+HELP_BUBBLE_TEMPLATE = '<div class="help-bubble">{message}</div>'
+INFO_CARD_TEMPLATE = (
+    '<div class="info-card">'
+    '<div class="info-card-title">{title}</div>'
+    '<div class="info-card-content">{content}</div>'
+    '</div>'
+)
+
 def show_help_bubble(message, key=None):
     """Display an animated help bubble"""
-    st.markdown(f'<div class="help-bubble">{message}</div>', unsafe_allow_html=True)
+    st.markdown(HELP_BUBBLE_TEMPLATE.format(message=message), unsafe_allow_html=True)
 
 def show_info_card(title, content):
     """Display an information card"""
-    st.markdown(f"""
-    <div class="info-card">
-        <div class="info-card-title">{title}</div>
-        <div class="info-card-content">{content}</div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(INFO_CARD_TEMPLATE.format(title=title, content=content), unsafe_allow_html=True)
+
+def show_sidebar_section(title):
+    """Display a centered section heading in the sidebar"""
+    st.markdown(
+        "<div style='text-align: center; margin-bottom: 1rem;'>"
+        f"<h3 style='color: #60a5fa; font-size: 1.1rem; margin-bottom: 1rem;'>{title}</h3>"
+        "</div>",
+        unsafe_allow_html=True
+    )
+
+# Static reference tables. Every widget interaction reruns the script, so these are
+# built once and served from the cache instead of rebuilding the DataFrames per rerun
+@st.cache_data
+def load_source_stats():
+    """Per-source ingestion statistics shown on the Log Ingestion page"""
+    return pd.DataFrame({
+        "Source Category": [
+            "AI/ML Applications",
+            "RAG Pipeline",
+            "Model Metrics",
+            "User Interactions",
+            "Infrastructure",
+            "Governance & Compliance"
+        ],
+        "Log Volume": ["45,234", "32,156", "15,890", "23,456", "67,123", "12,345"],
+        "Avg Size (KB)": [2.3, 1.8, 0.5, 1.2, 3.4, 1.9],
+        "Error Rate": ["0.5%", "0.2%", "0.0%", "1.2%", "2.1%", "0.3%"],
+        "Forwarders": [45, 12, 8, 23, 156, 6],
+        "Status": ["🟢 Healthy", "🟢 Healthy", "🟢 Healthy", "🟢 Healthy", "🟡 Warning", "🟢 Healthy"]
+    })
+
+@st.cache_data
+def load_alert_stats():
+    """Alert counts by severity shown on the Processing page"""
+    return pd.DataFrame({
+        "Type": ["Critical", "Warning", "Info"],
+        "Last 24h": [12, 45, 156],
+        "Last 7d": [89, 324, 1245]
+    })
+
+@st.cache_data
+def load_storage_tiers():
+    """Indexer storage tier details shown on the Storage page"""
+    return pd.DataFrame({
+        "Tier": ["Hot (NVMe SSD)", "Warm (SATA SSD)", "Cold (S3)", "Frozen (Glacier)"],
+        "Capacity": ["5 TB", "15 TB", "100 TB", "500 TB"],
+        "Used": ["2.4 TB", "8.7 TB", "45.2 TB", "234.5 TB"],
+        "Usage %": ["48%", "58%", "45%", "47%"],
+        "Retention": ["7-30 days", "30-90 days", "90-365 days", "1-7 years"],
+        "Search Speed": ["< 1s", "2-5s", "10-30s", "1-12h"],
+        "Replication": ["3x", "2x", "1x", "1x"],
+        "Cost/GB/Month": ["$0.15", "$0.08", "$0.023", "$0.004"]
+    })
+
+@st.cache_data
+def load_retention_policies():
+    """Retention policy per index shown on the Storage page"""
+    return pd.DataFrame({
+        "Index": ["aiml_models", "aiml_training", "aiml_rag", "infrastructure", "security_audit", "devops_ci_cd"],
+        "Hot": ["14 days", "7 days", "14 days", "3 days", "30 days", "7 days"],
+        "Warm": ["60 days", "30 days", "60 days", "14 days", "90 days", "30 days"],
+        "Cold": ["180 days", "90 days", "180 days", "90 days", "365 days", "90 days"],
+        "Archive": ["3 years", "1 year", "3 years", "Purge", "7 years", "1 year"],
+        "Total Size": ["12.5 TB", "8.3 TB", "15.7 TB", "45.2 TB", "23.4 TB", "5.6 TB"],
+        "Compliance": ["SOC2", "Internal", "SOC2", "Internal", "SOC2, HIPAA, GDPR", "Internal"]
+    })
+
+@st.cache_data
+def load_spl_results(template):
+    """Canned result table for an SPL console template, keyed by the template name"""
+    if "Model Performance" in template:
+        return pd.DataFrame({
+            "model_name": MODEL_NAMES,
+            "avg(latency_ms)": [850, 920, 1200, 780, 950],
+            "avg(tokens_total)": [1250, 1180, 890, 1320, 1050],
+            "sum(cost_usd)": [234.56, 189.23, 145.67, 267.89, 178.90]
+        })
+    if "Hallucination" in template:
+        return pd.DataFrame({
+            "model_name": ["GPT-4", "Claude-3", "Llama-2"],
+            "count": [145, 87, 234]
+        })
+    if "Cost by User" in template:
+        return pd.DataFrame({
+            "user_id": ["data_science_team", "user_001", "ml_ops_team", "user_002", "user_003"],
+            "total_cost": [456.78, 234.56, 189.45, 145.67, 98.34]
+        })
+    # The remaining templates show a timeline ending now, which must not be cached
+    return None
+
+# Charts over fixed data. Plotly validates every property while a figure is built, so
+# the figures are built once and shared instead of being rebuilt on each rerun
+@st.cache_resource
+def model_latency_figure():
+    """Average latency per model for the Overview dashboard"""
+    models = ["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro", "Mistral-7B"]
+    latencies = [850, 920, 1200, 780, 950]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=models,
+        y=latencies,
+        marker=dict(
+            color=latencies,
+            colorscale='Viridis',
+            showscale=False
+        ),
+        text=[f"{l}ms" for l in latencies],
+        textposition='outside',
+        hovertemplate='<b>Model:</b> %{x}<br><b>Latency:</b> %{y}ms<extra></extra>'
+    ))
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis_title="Model",
+        yaxis_title="Avg Latency (ms)",
+        showlegend=False
+    )
+    return fig
+
+@st.cache_resource
+def rag_latency_figure():
+    """Average and P95 latency per RAG stage for the Overview dashboard"""
+    stages = ["Ingestion", "Embedding", "Retrieval", "Prompt", "Inference", "Post-Proc"]
+    avg_latency = [35, 150, 60, 12, 2100, 18]
+    p95_latency = [45, 200, 85, 18, 2800, 25]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='Avg Latency', 
+        x=stages, 
+        y=avg_latency, 
+        marker_color='#10B981',
+        hovertemplate='<b>%{x}</b><br>Avg: %{y}ms<extra></extra>'
+    ))
+    fig.add_trace(go.Bar(
+        name='P95 Latency', 
+        x=stages, 
+        y=p95_latency, 
+        marker_color='#F59E0B',
+        hovertemplate='<b>%{x}</b><br>P95: %{y}ms<extra></extra>'
+    ))
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        barmode='group',
+        xaxis_title="Pipeline Stage",
+        yaxis_title="Latency (ms)",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+@st.cache_resource
+def rag_throughput_figure():
+    """Throughput per RAG stage for the Overview dashboard"""
+    stages = ["Ingestion", "Embedding", "Retrieval", "Prompt", "Inference", "Post-Proc"]
+    throughput = [12000, 11800, 11500, 11400, 9800, 9750]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=stages,
+        y=throughput,
+        mode='lines+markers',
+        line=dict(color='#8B5CF6', width=3),
+        marker=dict(size=10),
+        hovertemplate='<b>%{x}</b><br>Throughput: %{y} req/sec<extra></extra>'
+    ))
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis_title="Pipeline Stage",
+        yaxis_title="Throughput (req/sec)",
+    )
+    return fig
+
+@st.cache_resource
+def storage_distribution_figure():
+    """Share of data held in each storage tier"""
+    sizes = [2.4, 8.7, 45.2, 234.5]
+    labels = ["Hot", "Warm", "Cold", "Frozen"]
+    
+    fig = go.Figure(data=[go.Pie(
+        labels=labels,
+        values=sizes,
+        hole=0.4,
+        marker=dict(colors=['#EF4444', '#F59E0B', '#3B82F6', '#8B5CF6']),
+        hovertemplate='<b>%{label}</b><br>Size: %{value} TB<br>Percentage: %{percent}<extra></extra>'
+    )])
+    fig.update_layout(height=300, margin=dict(l=0, r=0, t=0, b=0))
+    return fig
+
+@st.cache_resource
+def storage_cost_figure():
+    """Monthly storage cost per index"""
+    indices = list(load_retention_policies()["Index"])
+    costs = [1245, 834, 1570, 452, 2340, 560]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=indices,
+        y=costs,
+        marker_color='#8B5CF6',
+        text=[f"${c}" for c in costs],
+        textposition='outside',
+        hovertemplate='<b>%{x}</b><br>Monthly Cost: $%{y}<extra></extra>'
+    ))
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis_title="Index",
+        yaxis_title="Monthly Cost (USD)",
+        xaxis_tickangle=-45
+    )
+    return fig
+
+@st.cache_resource
+def data_movement_figure():
+    """Tier-to-tier data movement events over the last 24h"""
+    movements = {
+        "Hot → Warm": 2345,
+        "Warm → Cold": 1876,
+        "Cold → Frozen": 456,
+        "Frozen → Purge": 89
+    }
+    
+    fig = go.Figure(data=[go.Pie(
+        labels=list(movements.keys()),
+        values=list(movements.values()),
+        hole=0.3,
+        hovertemplate='<b>%{label}</b><br>Events: %{value:,}<extra></extra>'
+    )])
+    fig.update_layout(height=300, margin=dict(l=0, r=0, t=0, b=0))
+    return fig
+
+@st.cache_resource
+def load_collection_info():
+    """Collection details per source category, with the info box HTML rendered once"""
+    sources = {
+        "🤖 AI/ML Applications": {
+            "forwarder": "Universal Forwarder (sidecar)",
+            "frequency": "Real-time (streaming)",
+            "protocol": "HTTP/HTTPS, gRPC",
+            "parsing": "JSON + custom timestamp extraction",
+            "index": "aiml_models, aiml_training"
+        },
+        "🔗 RAG Pipeline": {
+            "forwarder": "Heavy Forwarder (central)",
+            "frequency": "Real-time (per-stage)",
+            "protocol": "HTTP API endpoints",
+            "parsing": "JSON + trace ID correlation",
+            "index": "aiml_rag"
+        },
+        "📊 Model Metrics": {
+            "forwarder": "Heavy Forwarder (aggregator)",
+            "frequency": "Every 60 seconds (batch)",
+            "protocol": "Prometheus metrics → transformed",
+            "parsing": "Metric transformation + enrichment",
+            "index": "aiml_metrics"
+        },
+        "👥 User Interactions": {
+            "forwarder": "Universal Forwarder (web tier)",
+            "frequency": "Real-time (event-based)",
+            "protocol": "HTTPS",
+            "parsing": "W3C Extended Log + user enrichment",
+            "index": "user_activity"
+        },
+        "🖥️ Infrastructure": {
+            "forwarder": "Universal Forwarder (DaemonSet)",
+            "frequency": "Real-time + 30-second intervals",
+            "protocol": "Kubernetes API, syslog",
+            "parsing": "K8s events + system metrics",
+            "index": "infrastructure"
+        },
+        "🔒 Governance & Compliance": {
+            "forwarder": "Heavy Forwarder (policy engine)",
+            "frequency": "Real-time (policy evaluation)",
+            "protocol": "Internal API",
+            "parsing": "Policy DSL + audit formatting",
+            "index": "security_audit"
+        }
+    }
+    
+    # Both boxes share one grid element instead of a column pair holding two alerts
+    for info in sources.values():
+        info['boxes_html'] = (
+            "<div class='alert-grid'>"
+            "<div class='info-box'><strong>Collection Configuration:</strong><ul>"
+            f"<li><strong>Forwarder Type</strong>: {info['forwarder']}</li>"
+            f"<li><strong>Collection Frequency</strong>: {info['frequency']}</li>"
+            f"<li><strong>Protocol</strong>: {info['protocol']}</li>"
+            "</ul></div>"
+            "<div class='success-box'><strong>Processing &amp; Storage:</strong><ul>"
+            f"<li><strong>Parsing Method</strong>: {info['parsing']}</li>"
+            f"<li><strong>Target Index</strong>: <code>{info['index']}</code></li>"
+            "<li><strong>Retention</strong>: 14-180 days (configurable)</li>"
+            "</ul></div>"
+            "</div>"
+        )
+    # Shared by every session; the proxy keeps callers from mutating the cached dict
+    return MappingProxyType(sources)
+
+def quick_stats_deltas(version):
+    """Sidebar Quick Stats deltas, regenerated only when the version changes"""
+    # Kept in the session rather than st.cache_data, which would share the deltas between
+    # sessions and keep one entry per version ever seen
+    cached = st.session_state.get('quick_stats_deltas')
+    if cached is None or cached[0] != version:
+        cached = st.session_state.quick_stats_deltas = (version, {
+            'logs': f"+{random.randint(100, 500)}",
+            'alerts': f"{random.randint(-2, 3)}",
+            'cost': f"+${random.uniform(0.5, 2.0):.2f}"
+        })
+    return cached[1]
+
+CONFIG_PORTAL_URL = "https://aimlobs.streamlit.app"
+# Styled by .config-portal-link in portal.css, so only the anchor itself is sent each rerun
+CONFIG_PORTAL_LINK_HTML = (
+    f'<a href="{CONFIG_PORTAL_URL}" target="_blank" class="config-portal-link">'
+    '🔧 Open Config Portal →</a>'
+)
+
+# Title and subtitle go out as one element
+HEADER_HTML = (
+    '<h1 class="main-header">🔍 AI/ML Observability Platform</h1>'
+    '<p class="sub-header">Interactive Prototype - Real-time Log Ingestion & Analytics with Splunk</p>'
+)
+
+QUICK_GUIDE_MD = """
+**Navigation:**
+- Click any layer to explore
+- Each layer simulates real functionality
+
+**Features:**
+- Real-time log generation
+- Interactive SPL queries
+- RAG chain visualization
+- Cost analytics
+
+**Tip:** Start with Overview Dashboard!
+"""
 
 # Header with welcome message
-st.markdown('<h1 class="main-header">🔍 AI/ML Observability Platform</h1>', unsafe_allow_html=True)
-st.markdown('<p class="sub-header">Interactive Prototype - Real-time Log Ingestion & Analytics with Splunk</p>', unsafe_allow_html=True)
+st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 # Welcome guide toggle
 col1, col2, col3 = st.columns([1, 2, 1])
@@ -542,7 +724,7 @@ with col2:
             st.session_state.show_help = True
             st.rerun()
 
-st.markdown("---")
+st.divider()
 
 # Professional centered sidebar navigation
 with st.sidebar:
@@ -557,7 +739,7 @@ with st.sidebar:
     </div>
     """, unsafe_allow_html=True)
     
-    st.markdown("---")
+    st.divider()
     
     # Navigation with centered styling
     page = st.radio(
@@ -572,41 +754,18 @@ with st.sidebar:
         label_visibility="visible"
     )
     
-    st.markdown("---")
+    st.divider()
     
     
     # Configuration Portal Link
-    st.markdown("""
-    <div style='text-align: center; margin-bottom: 1rem;'>
-        <h3 style='color: #60a5fa; font-size: 1.1rem; margin-bottom: 1rem;'>⚙️ Configuration</h3>
-    </div>
-    """, unsafe_allow_html=True)
+    show_sidebar_section("⚙️ Configuration")
     
-    st.markdown("""
-    <a href="https://aimlobs.streamlit.app" target="_blank" style="
-        display: block;
-        background: linear-gradient(135deg, #3b82f6 0%, #1e40af 100%);
-        color: white;
-        padding: 0.75rem 1rem;
-        border-radius: 8px;
-        text-align: center;
-        text-decoration: none;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 12px rgba(59, 130, 246, 0.3);
-    ">
-        🔧 Open Config Portal →
-    </a>
-    """, unsafe_allow_html=True)
+    st.markdown(CONFIG_PORTAL_LINK_HTML, unsafe_allow_html=True)
     
-    st.markdown("---")
+    st.divider()
 
     # System Status Section
-    st.markdown("""
-    <div style='text-align: center; margin-bottom: 1rem;'>
-        <h3 style='color: #60a5fa; font-size: 1.1rem; margin-bottom: 1rem;'>📊 System Status</h3>
-    </div>
-    """, unsafe_allow_html=True)
+    show_sidebar_section("📊 System Status")
     
     st.success("✅ All systems operational")
     
@@ -618,40 +777,39 @@ with st.sidebar:
     
     st.metric("Active Forwarders", "156", delta="2")
     
-    st.markdown("---")
+    st.divider()
     
     # Quick Stats Section
-    st.markdown("""
-    <div style='text-align: center; margin-bottom: 1rem;'>
-        <h3 style='color: #60a5fa; font-size: 1.1rem; margin-bottom: 1rem;'>📈 Quick Stats</h3>
-    </div>
-    """, unsafe_allow_html=True)
+    show_sidebar_section("📈 Quick Stats")
     
-    st.metric("Total Logs Today", f"{st.session_state.log_count:,}", delta=f"+{random.randint(100, 500)}")
-    st.metric("Active Alerts", st.session_state.alert_count, delta=f"{random.randint(-2, 3)}")
-    st.metric("Total Cost (24h)", f"${st.session_state.total_cost:.2f}", delta=f"+${random.uniform(0.5, 2.0):.2f}")
+    # The deltas are only regenerated when logs are captured or cleared, not on every
+    # widget interaction
+    ss = st.session_state
+    deltas = quick_stats_deltas(ss.log_version)
+    st.metric("Total Logs Today", f"{ss.log_count:,}", delta=deltas['logs'])
+    st.metric("Active Alerts", ss.alert_count, delta=deltas['alerts'])
+    st.metric("Total Cost (24h)", f"${ss.total_cost:.2f}", delta=deltas['cost'])
     
-    st.markdown("---")
+    st.divider()
     
     # Help section
     with st.expander("📖 Quick Guide"):
-        st.markdown("""
-        **Navigation:**
-        - Click any layer to explore
-        - Each layer simulates real functionality
-        
-        **Features:**
-        - Real-time log generation
-        - Interactive SPL queries  
-        - RAG chain visualization
-        - Cost analytics
-        
-        **Tip:** Start with Overview Dashboard!
-        """)
+        st.markdown(QUICK_GUIDE_MD)
+    
+    st.toggle(
+        "⚡ Minimal UI",
+        key="minimal_ui",
+        help="Skip simulated query delays and decorative animations"
+    )
 
-# Page content based on selection
-if page == "🏠 Overview Dashboard":
-    if st.session_state.show_help:
+# Page content based on selection. The help flag is read once here; every page
+# checks it several times and the toggle above reruns the script when it changes
+show_help = st.session_state.show_help
+minimal_ui = st.session_state.minimal_ui
+
+def render_overview():
+    """Executive KPIs, charts and active alerts"""
+    if show_help:
         show_info_card(
             "🎯 Overview Dashboard", 
             "This executive dashboard provides high-level KPIs and metrics across all layers. " 
@@ -706,9 +864,9 @@ if page == "🏠 Overview Dashboard":
             help="Average cost per model inference request"
         )
     
-    st.markdown("---")
+    st.divider()
     
-    if st.session_state.show_help:
+    if show_help:
         show_help_bubble("📈 These charts update in real-time. Hover over data points for detailed information!")
     
     # Two column layout for charts
@@ -744,136 +902,178 @@ if page == "🏠 Overview Dashboard":
     with col2:
         st.subheader("🎯 Model Performance Distribution")
         
-        models = ["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro", "Mistral-7B"]
-        latencies = [850, 920, 1200, 780, 950]
-        
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=models,
-            y=latencies,
-            marker=dict(
-                color=latencies,
-                colorscale='Viridis',
-                showscale=False
-            ),
-            text=[f"{l}ms" for l in latencies],
-            textposition='outside',
-            hovertemplate='<b>Model:</b> %{x}<br><b>Latency:</b> %{y}ms<extra></extra>'
-        ))
-        fig.update_layout(
-            height=300,
-            margin=dict(l=0, r=0, t=0, b=0),
-            xaxis_title="Model",
-            yaxis_title="Avg Latency (ms)",
-            showlegend=False
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(model_latency_figure(), use_container_width=True)
     
-    st.markdown("---")
+    st.divider()
     
     # RAG Pipeline Health
     st.subheader("🔄 RAG Pipeline Stage Performance")
     
-    if st.session_state.show_help:
+    if show_help:
         show_info_card(
             "🔄 RAG Pipeline Monitoring",
             "Monitor each stage of your Retrieval-Augmented Generation pipeline. "
             "Track latency and throughput to identify bottlenecks and optimize performance."
         )
     
-    stages = ["Ingestion", "Embedding", "Retrieval", "Prompt", "Inference", "Post-Proc"]
-    avg_latency = [35, 150, 60, 12, 2100, 18]
-    p95_latency = [45, 200, 85, 18, 2800, 25]
-    throughput = [12000, 11800, 11500, 11400, 9800, 9750]
-    
     col1, col2 = st.columns(2)
     
     with col1:
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Avg Latency', 
-            x=stages, 
-            y=avg_latency, 
-            marker_color='#10B981',
-            hovertemplate='<b>%{x}</b><br>Avg: %{y}ms<extra></extra>'
-        ))
-        fig.add_trace(go.Bar(
-            name='P95 Latency', 
-            x=stages, 
-            y=p95_latency, 
-            marker_color='#F59E0B',
-            hovertemplate='<b>%{x}</b><br>P95: %{y}ms<extra></extra>'
-        ))
-        fig.update_layout(
-            height=300,
-            margin=dict(l=0, r=0, t=0, b=0),
-            barmode='group',
-            xaxis_title="Pipeline Stage",
-            yaxis_title="Latency (ms)",
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(rag_latency_figure(), use_container_width=True)
     
     with col2:
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=stages,
-            y=throughput,
-            mode='lines+markers',
-            line=dict(color='#8B5CF6', width=3),
-            marker=dict(size=10),
-            hovertemplate='<b>%{x}</b><br>Throughput: %{y} req/sec<extra></extra>'
-        ))
-        fig.update_layout(
-            height=300,
-            margin=dict(l=0, r=0, t=0, b=0),
-            xaxis_title="Pipeline Stage",
-            yaxis_title="Throughput (req/sec)",
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(rag_throughput_figure(), use_container_width=True)
     
-    st.markdown("---")
+    st.divider()
     
     # Active Alerts
     st.subheader("⚠️ Active Alerts & Anomalies")
     
-    if st.session_state.show_help:
+    if show_help:
         show_help_bubble("🚨 Alerts are automatically generated based on predefined thresholds and ML-powered anomaly detection")
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
+    # One CSS grid in a single element rather than a column container per alert box
+    st.markdown("""
+    <div class="alert-grid">
         <div class="error-box">
             <strong>🔴 CRITICAL</strong><br/>
             High hallucination rate detected in GPT-4<br/>
             <small>Threshold: 15% | Current: 18.3%</small><br/>
             <small>📍 Action: PagerDuty incident #12345 created</small>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
         <div class="warning-box">
             <strong>🟡 WARNING</strong><br/>
             Claude-3 latency increasing<br/>
             <small>Baseline: 850ms | Current: 1240ms</small><br/>
             <small>📍 Action: Slack notification sent to #ml-ops</small>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
         <div class="success-box">
             <strong>🟢 INFO</strong><br/>
             Cost optimization detected<br/>
             <small>Savings: $234.50 (24h)</small><br/>
             <small>📍 Action: Report emailed to FinOps team</small>
         </div>
-        """, unsafe_allow_html=True)
+    </div>
+    """, unsafe_allow_html=True)
 
-elif page == "📥 Layer 1: Log Ingestion":
-    if st.session_state.show_help:
+
+# (icon, title, subtitle, border colour, title colour) for each card in the architecture diagram
+ARCHITECTURE_SOURCES = (
+    ("🤖", "AI/ML Applications", "Model serving, training, pipelines", "#3b82f6", "#1e40af"),
+    ("🔗", "RAG Pipeline", "Complete chain tracing", "#8b5cf6", "#7c3aed"),
+    ("📊", "Model Metrics", "Performance & quality KPIs", "#10b981", "#059669"),
+    ("👥", "User Interactions", "Behavioral & audit data", "#f59e0b", "#d97706"),
+    ("🖥️", "Infrastructure", "System health & events", "#ef4444", "#dc2626"),
+    ("🔒", "Governance & Compliance", "Policy & regulatory", "#6366f1", "#4f46e5")
+)
+
+@st.cache_resource
+def architecture_html():
+    """Log collection architecture diagram for the Log Ingestion page, rendered to HTML once"""
+    cards = "".join(
+        f"<div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid {border};'>"
+        f"<div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>{icon}</div>"
+        f"<strong style='color: {color};'>{title}</strong><br/>"
+        f"<small style='color: #64748b;'>{subtitle}</small>"
+        "</div>"
+        for icon, title, subtitle, border, color in ARCHITECTURE_SOURCES
+    )
+    return (
+        "<div style='background: linear-gradient(135deg, #eff6ff 0%, #dbeafe 100%); "
+        "padding: 2rem; border-radius: 12px; margin: 1rem 0;'>"
+        "<div style='text-align: center; margin-bottom: 1.5rem;'>"
+        "<h3 style='color: #1e40af; margin: 0;'>Data Flow: Sources → Forwarders → Splunk Platform</h3>"
+        "</div>"
+        "<div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; margin-bottom: 1.5rem;'>"
+        f"{cards}"
+        "</div>"
+        "<div style='text-align: center; padding: 1rem; background: rgba(59, 130, 246, 0.1); border-radius: 8px;'>"
+        "<div style='font-size: 1.2rem; margin-bottom: 0.5rem;'>⬇️</div>"
+        "<strong style='color: #1e40af;'>Universal Forwarders (156 active)</strong> → "
+        "<strong style='color: #7c3aed;'>Heavy Forwarders (12 active)</strong> → "
+        "<strong style='color: #059669;'>Splunk Indexers (12 active)</strong>"
+        "</div>"
+        "</div>"
+    )
+
+# Status indicator for the sample logs; logs without a status map through None
+STATUS_EMOJI = MappingProxyType({
+    "success": "🟢",
+    "compliant": "🟢",
+    "healthy": "🟢",
+    "warning": "🟡",
+    "degraded": "🟡",
+    None: "⚪"
+})
+
+# Headline metrics per source category, as st.metric keyword arguments
+SOURCE_METRICS = MappingProxyType({
+    "🤖 AI/ML Applications": (
+        dict(label="Logs/Hour", value="45,234", delta="+2,341", help="Log generation rate"),
+        dict(label="Active Models", value="5", help="Currently served models"),
+        dict(label="Avg Latency", value="847ms", delta="-23ms", help="Model response time"),
+        dict(label="GPU Utilization", value="73%", delta="+5%", help="GPU usage across cluster")
+    ),
+    "🔗 RAG Pipeline": (
+        dict(label="Chain Executions", value="32,156", delta="+1,543", help="Complete RAG chains"),
+        dict(label="Avg Chain Time", value="2,375ms", delta="+125ms", help="End-to-end latency"),
+        dict(label="Retrieval Accuracy", value="94.3%", delta="+1.2%", help="Vector search quality"),
+        dict(label="Documents Indexed", value="1.2M", help="Total documents in vector DB")
+    ),
+    "📊 Model Metrics": (
+        dict(label="P95 Latency", value="1,240ms", delta="+140ms", help="95th percentile response time"),
+        dict(label="Hallucination Rate", value="2.3%", delta="-0.5%", delta_color="inverse", help="Detected hallucinations"),
+        dict(label="Drift Events", value="3", delta="+1", help="Model drift detections today"),
+        dict(label="Quality Score", value="0.94", delta="+0.02", help="Average quality metric")
+    ),
+    "👥 User Interactions": (
+        dict(label="Active Users", value="234", delta="+12", help="Unique users today"),
+        dict(label="Sessions", value="5,678", delta="+234", help="Total sessions"),
+        dict(label="Avg Duration", value="8.3 min", delta="+1.2 min", help="Average session length"),
+        dict(label="Failed Logins", value="12", delta="-3", delta_color="inverse", help="Authentication failures")
+    ),
+    "🖥️ Infrastructure": (
+        dict(label="Cluster Nodes", value="20", help="Total Kubernetes nodes"),
+        dict(label="Avg CPU", value="67%", delta="+5%", help="Average CPU utilization"),
+        dict(label="Memory Usage", value="73%", delta="+2%", help="Average memory utilization"),
+        dict(label="Incidents", value="2", delta="-1", delta_color="inverse", help="Active incidents")
+    ),
+    "🔒 Governance & Compliance": (
+        dict(label="Policy Checks", value="15,234", delta="+1,234", help="Policy evaluations"),
+        dict(label="Violations", value="3", delta="-2", delta_color="inverse", help="Policy violations"),
+        dict(label="Anomalies", value="7", delta="+2", help="Detected anomalies"),
+        dict(label="Audit Events", value="2,456", delta="+123", help="Audit trail entries")
+    )
+})
+
+# Logs per page in the simulator's log browser
+LOG_PAGE_SIZE = 10
+
+def mark_inspector_rerun():
+    """on_change callback for the log browser: paging or picking a log doesn't capture a new one"""
+    st.session_state.inspector_rerun = True
+
+def select_inspected_log():
+    """on_change callback for the log selector: remember the picked log by id"""
+    st.session_state.inspected_log_id = st.session_state.log_selected
+    mark_inspector_rerun()
+
+def log_id(log):
+    """Stable key of a captured log, unaffected by logs appended after it"""
+    return f"{log['timestamp']}|{log['trace_id']}"
+
+# Fixed enrichment block for the Log Inspector, heading included so it is one element
+METADATA_ENRICHMENT_MD = """
+##### 🎯 Metadata Enrichment
+- **Environment**: `production`
+- **Region**: `us-west-2`
+- **Cluster**: `ml-cluster-01`
+- **Version**: `v2.4.1`
+"""
+
+def render_log_ingestion():
+    """Log sources, live simulator, forwarders and ingestion metrics"""
+    if show_help:
         show_info_card(
             "📥 Log Ingestion Layer",
             "This layer captures logs from all sources using Universal and Heavy Forwarders. "
@@ -894,7 +1094,7 @@ elif page == "📥 Layer 1: Log Ingestion":
     with tab1:
         st.subheader("🎯 Six Primary Log Source Categories")
         
-        if st.session_state.show_help:
+        if show_help:
             show_info_card(
                 "📚 Understanding the Six Log Sources",
                 "This platform captures logs from six distinct source categories, each providing unique "
@@ -904,143 +1104,29 @@ elif page == "📥 Layer 1: Log Ingestion":
         # Visual Architecture Diagram
         st.markdown("##### 🏗️ Log Collection Architecture")
         
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #eff6ff 0%, #dbeafe 100%); 
-                    padding: 2rem; border-radius: 12px; margin: 1rem 0;'>
-            <div style='text-align: center; margin-bottom: 1.5rem;'>
-                <h3 style='color: #1e40af; margin: 0;'>Data Flow: Sources → Forwarders → Splunk Platform</h3>
-            </div>
-            <div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; margin-bottom: 1.5rem;'>
-                <div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid #3b82f6;'>
-                    <div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>🤖</div>
-                    <strong style='color: #1e40af;'>AI/ML Applications</strong><br/>
-                    <small style='color: #64748b;'>Model serving, training, pipelines</small>
-                </div>
-                <div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid #8b5cf6;'>
-                    <div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>🔗</div>
-                    <strong style='color: #7c3aed;'>RAG Pipeline</strong><br/>
-                    <small style='color: #64748b;'>Complete chain tracing</small>
-                </div>
-                <div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid #10b981;'>
-                    <div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>📊</div>
-                    <strong style='color: #059669;'>Model Metrics</strong><br/>
-                    <small style='color: #64748b;'>Performance & quality KPIs</small>
-                </div>
-                <div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid #f59e0b;'>
-                    <div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>👥</div>
-                    <strong style='color: #d97706;'>User Interactions</strong><br/>
-                    <small style='color: #64748b;'>Behavioral & audit data</small>
-                </div>
-                <div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid #ef4444;'>
-                    <div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>🖥️</div>
-                    <strong style='color: #dc2626;'>Infrastructure</strong><br/>
-                    <small style='color: #64748b;'>System health & events</small>
-                </div>
-                <div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid #6366f1;'>
-                    <div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>🔒</div>
-                    <strong style='color: #4f46e5;'>Governance & Compliance</strong><br/>
-                    <small style='color: #64748b;'>Policy & regulatory</small>
-                </div>
-            </div>
-            <div style='text-align: center; padding: 1rem; background: rgba(59, 130, 246, 0.1); border-radius: 8px;'>
-                <div style='font-size: 1.2rem; margin-bottom: 0.5rem;'>⬇️</div>
-                <strong style='color: #1e40af;'>Universal Forwarders (156 active)</strong> → 
-                <strong style='color: #7c3aed;'>Heavy Forwarders (12 active)</strong> → 
-                <strong style='color: #059669;'>Splunk Indexers (12 active)</strong>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(architecture_html(), unsafe_allow_html=True)
         
-        st.markdown("---")
+        st.divider()
         
         # Interactive Source Selector
         st.markdown("##### 🔍 Explore Each Source Category")
         
-        source_categories = [
-            "🤖 AI/ML Applications",
-            "🔗 RAG Pipeline", 
-            "📊 Model Metrics",
-            "👥 User Interactions",
-            "🖥️ Infrastructure",
-            "🔒 Governance & Compliance"
-        ]
-        
         selected_source = st.selectbox(
             "Select a source category to view sample logs:",
-            source_categories,
+            SOURCE_CATEGORIES,
             help="Choose a source to see what kind of logs it generates"
         )
         
         # Source Statistics
-        col1, col2, col3, col4 = st.columns(4)
+        for col, metric in zip(st.columns(4), SOURCE_METRICS[selected_source]):
+            col.metric(**metric)
         
-        # Generate stats based on selected source
-        if "AI/ML" in selected_source:
-            with col1:
-                st.metric("Logs/Hour", "45,234", delta="+2,341", help="Log generation rate")
-            with col2:
-                st.metric("Active Models", "5", help="Currently served models")
-            with col3:
-                st.metric("Avg Latency", "847ms", delta="-23ms", help="Model response time")
-            with col4:
-                st.metric("GPU Utilization", "73%", delta="+5%", help="GPU usage across cluster")
-                
-        elif "RAG" in selected_source:
-            with col1:
-                st.metric("Chain Executions", "32,156", delta="+1,543", help="Complete RAG chains")
-            with col2:
-                st.metric("Avg Chain Time", "2,375ms", delta="+125ms", help="End-to-end latency")
-            with col3:
-                st.metric("Retrieval Accuracy", "94.3%", delta="+1.2%", help="Vector search quality")
-            with col4:
-                st.metric("Documents Indexed", "1.2M", help="Total documents in vector DB")
-                
-        elif "Model Metrics" in selected_source:
-            with col1:
-                st.metric("P95 Latency", "1,240ms", delta="+140ms", help="95th percentile response time")
-            with col2:
-                st.metric("Hallucination Rate", "2.3%", delta="-0.5%", delta_color="inverse", help="Detected hallucinations")
-            with col3:
-                st.metric("Drift Events", "3", delta="+1", help="Model drift detections today")
-            with col4:
-                st.metric("Quality Score", "0.94", delta="+0.02", help="Average quality metric")
-                
-        elif "User" in selected_source:
-            with col1:
-                st.metric("Active Users", "234", delta="+12", help="Unique users today")
-            with col2:
-                st.metric("Sessions", "5,678", delta="+234", help="Total sessions")
-            with col3:
-                st.metric("Avg Duration", "8.3 min", delta="+1.2 min", help="Average session length")
-            with col4:
-                st.metric("Failed Logins", "12", delta="-3", delta_color="inverse", help="Authentication failures")
-                
-        elif "Infrastructure" in selected_source:
-            with col1:
-                st.metric("Cluster Nodes", "20", help="Total Kubernetes nodes")
-            with col2:
-                st.metric("Avg CPU", "67%", delta="+5%", help="Average CPU utilization")
-            with col3:
-                st.metric("Memory Usage", "73%", delta="+2%", help="Average memory utilization")
-            with col4:
-                st.metric("Incidents", "2", delta="-1", delta_color="inverse", help="Active incidents")
-                
-        else:  # Governance
-            with col1:
-                st.metric("Policy Checks", "15,234", delta="+1,234", help="Policy evaluations")
-            with col2:
-                st.metric("Violations", "3", delta="-2", delta_color="inverse", help="Policy violations")
-            with col3:
-                st.metric("Anomalies", "7", delta="+2", help="Detected anomalies")
-            with col4:
-                st.metric("Audit Events", "2,456", delta="+123", help="Audit trail entries")
-        
-        st.markdown("---")
+        st.divider()
         
         # Live Log Generation for Selected Source
         st.markdown(f"##### 📜 Sample Logs from: {selected_source}")
         
-        if st.session_state.show_help:
+        if show_help:
             show_help_bubble("👇 These are real-time sample logs showing the structure and fields captured from this source")
         
         # Generate button
@@ -1052,140 +1138,57 @@ elif page == "📥 Layer 1: Log Ingestion":
                 log = generate_source_specific_log(selected_source)
                 
                 # Color code based on status
-                if "status" in log:
-                    if log["status"] in ["success", "compliant", "healthy"]:
-                        status_emoji = "🟢"
-                    elif log["status"] in ["warning", "degraded"]:
-                        status_emoji = "🟡"
-                    else:
-                        status_emoji = "🔴"
-                else:
-                    status_emoji = "⚪"
+                status_emoji = STATUS_EMOJI.get(log.get("status"), "🔴")
                 
                 with st.expander(f"{status_emoji} Log #{i+1} - {log['timestamp']}", expanded=i==0):
-                    col1, col2 = st.columns([2, 1])
+                    # Key fields above the raw JSON: a column pair per log would add three containers
+                    # to every expander. Built up as one markdown block so the card is a single element
+                    key_fields = [
+                        "**Key Fields:**",
+                        f"- **Source**: {log['source_category']}",
+                        f"- **Trace ID**: `{log['trace_id']}`"
+                    ]
                     
-                    with col1:
-                        st.json(log)
+                    if "model" in log:
+                        key_fields.append(f"- **Model**: {log['model']}")
+                    if "latency_ms" in log:
+                        key_fields.append(f"- **Latency**: {log['latency_ms']}ms")
+                    if "stage" in log:
+                        key_fields.append(f"- **Stage**: {log['stage']}")
+                    if "user_id" in log:
+                        key_fields.append(f"- **User**: {log['user_id']}")
+                    if "host" in log:
+                        key_fields.append(f"- **Host**: {log['host']}")
+                    if "policy_type" in log:
+                        key_fields.append(f"- **Policy**: {log['policy_type']}")
                     
-                    with col2:
-                        st.markdown("**Key Fields:**")
-                        st.markdown(f"- **Source**: {log['source_category']}")
-                        st.markdown(f"- **Trace ID**: `{log['trace_id']}`")
-                        
-                        if "model" in log:
-                            st.markdown(f"- **Model**: {log['model']}")
-                        if "latency_ms" in log:
-                            st.markdown(f"- **Latency**: {log['latency_ms']}ms")
-                        if "stage" in log:
-                            st.markdown(f"- **Stage**: {log['stage']}")
-                        if "user_id" in log:
-                            st.markdown(f"- **User**: {log['user_id']}")
-                        if "host" in log:
-                            st.markdown(f"- **Host**: {log['host']}")
-                        if "policy_type" in log:
-                            st.markdown(f"- **Policy**: {log['policy_type']}")
-        
-        st.markdown("---")
+                    st.markdown("\n".join(key_fields))
+                    st.json(log)
+        
+        st.divider()
         
         # Collection Methods
         st.markdown("##### 🔧 Collection Methods by Source")
         
-        collection_info = {
-            "🤖 AI/ML Applications": {
-                "forwarder": "Universal Forwarder (sidecar)",
-                "frequency": "Real-time (streaming)",
-                "protocol": "HTTP/HTTPS, gRPC",
-                "parsing": "JSON + custom timestamp extraction",
-                "index": "aiml_models, aiml_training"
-            },
-            "🔗 RAG Pipeline": {
-                "forwarder": "Heavy Forwarder (central)",
-                "frequency": "Real-time (per-stage)",
-                "protocol": "HTTP API endpoints",
-                "parsing": "JSON + trace ID correlation",
-                "index": "aiml_rag"
-            },
-            "📊 Model Metrics": {
-                "forwarder": "Heavy Forwarder (aggregator)",
-                "frequency": "Every 60 seconds (batch)",
-                "protocol": "Prometheus metrics → transformed",
-                "parsing": "Metric transformation + enrichment",
-                "index": "aiml_metrics"
-            },
-            "👥 User Interactions": {
-                "forwarder": "Universal Forwarder (web tier)",
-                "frequency": "Real-time (event-based)",
-                "protocol": "HTTPS",
-                "parsing": "W3C Extended Log + user enrichment",
-                "index": "user_activity"
-            },
-            "🖥️ Infrastructure": {
-                "forwarder": "Universal Forwarder (DaemonSet)",
-                "frequency": "Real-time + 30-second intervals",
-                "protocol": "Kubernetes API, syslog",
-                "parsing": "K8s events + system metrics",
-                "index": "infrastructure"
-            },
-            "🔒 Governance & Compliance": {
-                "forwarder": "Heavy Forwarder (policy engine)",
-                "frequency": "Real-time (policy evaluation)",
-                "protocol": "Internal API",
-                "parsing": "Policy DSL + audit formatting",
-                "index": "security_audit"
-            }
-        }
+        collection_info = load_collection_info()
         
         if selected_source in collection_info:
-            info = collection_info[selected_source]
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.info(f"""
-                **Collection Configuration:**
-                
-                - **Forwarder Type**: {info['forwarder']}
-                - **Collection Frequency**: {info['frequency']}
-                - **Protocol**: {info['protocol']}
-                """)
-            
-            with col2:
-                st.success(f"""
-                **Processing & Storage:**
-                
-                - **Parsing Method**: {info['parsing']}
-                - **Target Index**: `{info['index']}`
-                - **Retention**: 14-180 days (configurable)
-                """)
+            st.markdown(collection_info[selected_source]['boxes_html'], unsafe_allow_html=True)
         
         # Summary Statistics
-        st.markdown("---")
+        st.divider()
         st.markdown("##### 📊 Overall Source Statistics (Last 24h)")
         
-        source_stats = pd.DataFrame({
-            "Source Category": [
-                "AI/ML Applications",
-                "RAG Pipeline",
-                "Model Metrics",
-                "User Interactions",
-                "Infrastructure",
-                "Governance & Compliance"
-            ],
-            "Log Volume": ["45,234", "32,156", "15,890", "23,456", "67,123", "12,345"],
-            "Avg Size (KB)": [2.3, 1.8, 0.5, 1.2, 3.4, 1.9],
-            "Error Rate": ["0.5%", "0.2%", "0.0%", "1.2%", "2.1%", "0.3%"],
-            "Forwarders": [45, 12, 8, 23, 156, 6],
-            "Status": ["🟢 Healthy", "🟢 Healthy", "🟢 Healthy", "🟢 Healthy", "🟡 Warning", "🟢 Healthy"]
-        })
+        source_stats = load_source_stats()
         
         st.dataframe(source_stats, use_container_width=True, hide_index=True)
     
-    # Tab 2: Live Simulator  
-    with tab2:
+    # Tab 2: Live Simulator
+    def live_simulator():
+        """Start/stop controls and the recent-log viewer"""
         st.subheader("🎮 Live Log Ingestion Simulator")
         
-        if st.session_state.show_help:
+        if show_help:
             show_info_card(
                 "🎮 Live Simulator",
                 "This simulator demonstrates real-time log ingestion. Click 'Start Ingestion' to begin generating logs from all six source categories."
@@ -1204,35 +1207,73 @@ elif page == "📥 Layer 1: Log Ingestion":
         with col3:
             if st.button("🗑️ Clear Logs", help="Clear all generated logs"):
                 st.session_state.log_history = []
+                st.session_state.log_version += 1
+                save_state('log_history', [])
         
-        st.markdown("---")
+        st.divider()
         
         # Status
         if st.session_state.get('ingestion_active', False):
             st.success("🟢 **Status**: Ingestion Active - Generating logs from all sources...")
             
-            # Generate a log from a random source
-            source_categories = [
-                "🤖 AI/ML Applications",
-                "🔗 RAG Pipeline", 
-                "📊 Model Metrics",
-                "👥 User Interactions",
-                "🖥️ Infrastructure",
-                "🔒 Governance & Compliance"
-            ]
-            new_log = generate_source_specific_log(random.choice(source_categories))
-            st.session_state.log_history.append(new_log)
+            # Generate a log from a random source, unless the rerun came from the log browser
+            log_history = st.session_state.log_history
+            if not st.session_state.pop('inspector_rerun', False):
+                log_history.append(generate_source_specific_log(random.choice(SOURCE_CATEGORIES)))
+                del log_history[:-MAX_LOG_HISTORY]
+                st.session_state.log_version += 1
+                # A copy, so later appends don't change the cached state outside the lock
+                save_state('log_history', list(log_history))
             
-            # Show recent logs
-            st.markdown("##### 📜 Recent Logs (Last 10)")
-            for i, log in enumerate(st.session_state.log_history[-10:][::-1]):
-                with st.expander(f"Log {len(st.session_state.log_history) - i} - {log['source_category']} - {log['timestamp']}", expanded=i==0):
-                    st.json(log)
+            # Show captured logs a page at a time, newest first, so page 1 always follows
+            # incoming logs. One selector plus one JSON view replaces an expander (and a JSON
+            # tree) per log, and paging keeps the selector's options the same size however
+            # long the history grows
+            st.markdown("##### 📜 Captured Logs")
+            total_logs = len(log_history)
+            page_count = max(-(-total_logs // LOG_PAGE_SIZE), 1)
+            # The bounds stay fixed: Streamlit resets a widget whose arguments change, so the
+            # page is clamped to the pages that exist instead
+            page_num = min(st.number_input(
+                "Page",
+                min_value=1,
+                max_value=MAX_LOG_HISTORY // LOG_PAGE_SIZE,
+                value=1,
+                key="log_page",
+                help="Page 1 holds the newest logs",
+                on_change=mark_inspector_rerun
+            ), page_count)
+            st.caption(f"Page {page_num} of {page_count}")
+            newest = total_logs - (page_num - 1) * LOG_PAGE_SIZE
+            page_logs = log_history[max(newest - LOG_PAGE_SIZE, 0):newest][::-1]
+            # The options change whenever a log arrives, and Streamlit 1.32 then recreates the
+            # widget and forgets its value. The picked log's id is kept in our own session key
+            # and passed back as index=, so the selection follows that log while it is on the page
+            page_ids = [log_id(log) for log in page_logs]
+            inspected = st.session_state.get('inspected_log_id')
+            log_labels = {
+                page_id: f"Log {newest - i} - {log['source_category']} - {log['timestamp']}"
+                for i, (page_id, log) in enumerate(zip(page_ids, page_logs))
+            }
+            selected = st.selectbox(
+                "Select a log to inspect:",
+                page_ids,
+                index=page_ids.index(inspected) if inspected in log_labels else 0,
+                format_func=log_labels.__getitem__,
+                key="log_selected",
+                on_change=select_inspected_log
+            )
+            st.json(page_logs[page_ids.index(selected)])
         else:
             st.info("⏸️ **Status**: Ingestion Paused - Click 'Start Ingestion' to begin")
             
-            if st.session_state.log_history:
-                st.markdown(f"##### 📊 Total Logs Captured: {len(st.session_state.log_history)}")
+            log_history = st.session_state.log_history
+            if log_history:
+                st.markdown(f"##### 📊 Total Logs Captured: {len(log_history)}")
+    
+    with tab2:
+        # Start/Stop/Clear and picking a log only rerun the simulator when fragments exist
+        (fragment(live_simulator) if fragment is not None else live_simulator)()
     
     # Tab 3: Forwarder Status
 
@@ -1241,7 +1282,7 @@ elif page == "📥 Layer 1: Log Ingestion":
     with tab3:
         st.subheader("📊 Universal Forwarder Status")
         
-        if st.session_state.show_help:
+        if show_help:
             show_info_card(
                 "📊 Forwarder Monitoring",
                 "Universal Forwarders are lightweight agents installed on application servers. "
@@ -1265,7 +1306,7 @@ elif page == "📥 Layer 1: Log Ingestion":
         df = pd.DataFrame(forwarders_data)
         st.dataframe(df, use_container_width=True, hide_index=True)
         
-        st.markdown("---")
+        st.divider()
         
         col1, col2 = st.columns(2)
         
@@ -1305,15 +1346,16 @@ elif page == "📥 Layer 1: Log Ingestion":
     with tab4:
         st.subheader("🔍 Log Inspector & Parser")
         
-        if st.session_state.show_help:
+        if show_help:
             show_info_card(
                 "🔍 Log Parsing",
                 "Heavy Forwarders parse logs to extract structured fields. "
                 "This enables fast searching and correlation across millions of events."
             )
         
-        if st.session_state.log_history:
-            selected_log = random.choice(st.session_state.log_history[-20:])
+        log_history = st.session_state.log_history
+        if log_history:
+            selected_log = random.choice(log_history[-20:])
             
             col1, col2 = st.columns([2, 1])
             
@@ -1331,13 +1373,7 @@ elif page == "📥 Layer 1: Log Ingestion":
                 - **Status**: `{selected_log['status']}`
                 """)
                 
-                st.markdown("##### 🎯 Metadata Enrichment")
-                st.markdown(f"""
-                - **Environment**: `production`
-                - **Region**: `us-west-2`
-                - **Cluster**: `ml-cluster-01`
-                - **Version**: `v2.4.1`
-                """)
+                st.markdown(METADATA_ENRICHMENT_MD)
         else:
             st.info("📭 Start ingestion in the 'Live Simulator' tab to see log details...")
     
@@ -1383,8 +1419,68 @@ elif page == "📥 Layer 1: Log Ingestion":
             )
             st.plotly_chart(fig, use_container_width=True)
 
-elif page == "⚙️ Layer 2: Processing":
-    if st.session_state.show_help:
+
+SEVERITY_BOX = MappingProxyType({
+    "🔴 CRITICAL": "error-box",
+    "🟡 WARNING": "warning-box",
+    "🟢 INFO": "success-box"
+})
+
+ALERT_TEMPLATE = """
+<div class="{box}">
+    <strong>{severity}: {title}</strong><br/>
+    {description}<br/>
+    <strong>Value:</strong> {value}<br/>
+    <small>⏰ {time} | 📤 {action}</small>
+</div>
+"""
+
+@st.cache_resource
+def active_alerts_html():
+    """Active alert boxes for the Processing page, rendered to HTML once"""
+    alerts = [
+        {
+            "severity": "🔴 CRITICAL",
+            "title": "High Hallucination Rate - GPT-4",
+            "description": "Hallucination rate exceeded 15% threshold",
+            "value": "18.3%",
+            "time": "2 minutes ago",
+            "action": "PagerDuty incident #12345 created"
+        },
+        {
+            "severity": "🟡 WARNING",
+            "title": "Increased Latency - Claude-3",
+            "description": "P95 latency above baseline",
+            "value": "1240ms (baseline: 850ms)",
+            "time": "15 minutes ago",
+            "action": "Slack notification sent to #ml-ops"
+        },
+        {
+            "severity": "🟡 WARNING",
+            "title": "Cost Anomaly Detected",
+            "description": "Hourly cost spike detected",
+            "value": "$125/hr (avg: $87/hr)",
+            "time": "32 minutes ago",
+            "action": "Email sent to FinOps team"
+        }
+    ]
+    return "".join(
+        ALERT_TEMPLATE.format(box=SEVERITY_BOX[alert['severity']], **alert)
+        for alert in alerts
+    )
+
+# Fixed channel list for the Alerting tab, heading included so it is one element
+NOTIFICATION_CHANNELS_MD = """
+##### 📨 Notification Channels
+- 🔔 PagerDuty: **Enabled**
+- 💬 Slack: **Enabled**
+- 📧 Email: **Enabled**
+- 📱 Teams: **Enabled**
+"""
+
+def render_processing():
+    """SPL console, ML analytics and alerting"""
+    if show_help:
         show_info_card(
             "⚙️ Processing & Analytics Layer",
             "This layer processes ingested logs using Splunk Processing Language (SPL), " 
@@ -1395,10 +1491,11 @@ elif page == "⚙️ Layer 2: Processing":
     
     tab1, tab2, tab3 = st.tabs(["🔧 SPL Queries", "🤖 ML Analytics", "⚡ Alerting"])
     
-    with tab1:
+    def spl_console():
+        """SPL template picker, query editor and results"""
         st.subheader("🔧 Search Processing Language (SPL) Console")
         
-        if st.session_state.show_help:
+        if show_help:
             show_help_bubble("💡 SPL is Splunk's query language. Select a template, customize if needed, and click 'Run Query' to see results!")
         
         # Predefined queries
@@ -1416,49 +1513,39 @@ elif page == "⚙️ Layer 2: Processing":
             help="Choose from pre-built queries for common use cases"
         )
         
-        query = st.text_area("SPL Query", value=query_templates[selected_template], height=100)
-        
-        col1, col2, col3 = st.columns([1, 1, 4])
-        with col1:
-            run_query = st.button("▶️ Run Query", type="primary")
-        with col2:
-            st.button("💾 Save Query")
+        # Editing the query doesn't rerun anything until it is run or saved. The template
+        # picker stays outside the form because it has to refill the editor immediately
+        with st.form("spl_query_form", border=False):
+            query = st.text_area("SPL Query", value=query_templates[selected_template], height=100)
+            
+            col1, col2, col3 = st.columns([1, 1, 4])
+            with col1:
+                run_query = st.form_submit_button("▶️ Run Query", type="primary")
+            with col2:
+                st.form_submit_button("💾 Save Query")
         
         if run_query:
             with st.spinner("Executing query..."):
-                time.sleep(1)
-                
+                if not minimal_ui:
+                    time.sleep(1)
+        
                 st.success("✅ Query completed in 0.847 seconds | Scanned 2.4M events")
-                
+        
                 # Generate results based on query type
-                if "Model Performance" in selected_template:
-                    results = pd.DataFrame({
-                        "model_name": ["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro", "Mistral-7B"],
-                        "avg(latency_ms)": [850, 920, 1200, 780, 950],
-                        "avg(tokens_total)": [1250, 1180, 890, 1320, 1050],
-                        "sum(cost_usd)": [234.56, 189.23, 145.67, 267.89, 178.90]
-                    })
-                elif "Hallucination" in selected_template:
-                    results = pd.DataFrame({
-                        "model_name": ["GPT-4", "Claude-3", "Llama-2"],
-                        "count": [145, 87, 234]
-                    })
-                elif "Cost by User" in selected_template:
-                    results = pd.DataFrame({
-                        "user_id": ["data_science_team", "user_001", "ml_ops_team", "user_002", "user_003"],
-                        "total_cost": [456.78, 234.56, 189.45, 145.67, 98.34]
-                    })
-                else:
+                results = load_spl_results(selected_template)
+                if results is None:
                     results = pd.DataFrame({
                         "_time": pd.date_range(end=datetime.now(), periods=5, freq='1S'),
                         "stage": ["ingestion", "embedding", "retrieval", "inference", "post-processing"],
                         "latency_ms": [35, 150, 60, 2100, 18]
                     })
-                
+        
                 st.dataframe(results, use_container_width=True, hide_index=True)
-                
+        
                 # Visualization
                 if "Model Performance" in selected_template or "Hallucination" in selected_template:
+                    # plotly.express pulls in a lot on import and is only needed for this chart
+                    import plotly.express as px
                     fig = px.bar(
                         results, 
                         x=results.columns[0], 
@@ -1470,10 +1557,14 @@ elif page == "⚙️ Layer 2: Processing":
                     fig.update_layout(height=300)
                     st.plotly_chart(fig, use_container_width=True)
     
+    with tab1:
+        # Picking a template or running a query only reruns the console when fragments exist
+        (fragment(spl_console) if fragment is not None else spl_console)()
+    
     with tab2:
         st.subheader("🤖 Machine Learning Toolkit (MLTK)")
         
-        if st.session_state.show_help:
+        if show_help:
             show_info_card(
                 "🤖 ML-Powered Analytics",
                 "Splunk's ML Toolkit detects anomalies, predicts trends, and identifies drift automatically. "
@@ -1561,11 +1652,11 @@ elif page == "⚙️ Layer 2: Processing":
             
             st.warning("⚠️ Features C and E exceed drift threshold (>0.15)")
         
-        st.markdown("---")
+        st.divider()
         
         st.markdown("##### 📈 Predictive Analytics - Capacity Forecast")
         
-        if st.session_state.show_help:
+        if show_help:
             show_help_bubble("📊 Forecasting helps plan infrastructure capacity and prevent resource shortages")
         
         days = pd.date_range(start=datetime.now() - timedelta(days=30), 
@@ -1609,7 +1700,7 @@ elif page == "⚙️ Layer 2: Processing":
     with tab3:
         st.subheader("⚡ Alert Manager & Notification System")
         
-        if st.session_state.show_help:
+        if show_help:
             show_info_card(
                 "⚡ Intelligent Alerting",
                 "Alerts are automatically generated when metrics exceed thresholds or anomalies are detected. "
@@ -1621,57 +1712,13 @@ elif page == "⚙️ Layer 2: Processing":
         with col1:
             st.markdown("##### 🔔 Active Alerts")
             
-            alerts = [
-                {
-                    "severity": "🔴 CRITICAL",
-                    "title": "High Hallucination Rate - GPT-4",
-                    "description": "Hallucination rate exceeded 15% threshold",
-                    "value": "18.3%",
-                    "time": "2 minutes ago",
-                    "action": "PagerDuty incident #12345 created"
-                },
-                {
-                    "severity": "🟡 WARNING",
-                    "title": "Increased Latency - Claude-3",
-                    "description": "P95 latency above baseline",
-                    "value": "1240ms (baseline: 850ms)",
-                    "time": "15 minutes ago",
-                    "action": "Slack notification sent to #ml-ops"
-                },
-                {
-                    "severity": "🟡 WARNING",
-                    "title": "Cost Anomaly Detected",
-                    "description": "Hourly cost spike detected",
-                    "value": "$125/hr (avg: $87/hr)",
-                    "time": "32 minutes ago",
-                    "action": "Email sent to FinOps team"
-                }
-            ]
-            
-            for alert in alerts:
-                severity_color = {
-                    "🔴 CRITICAL": "error-box",
-                    "🟡 WARNING": "warning-box",
-                    "🟢 INFO": "success-box"
-                }
-                
-                st.markdown(f"""
-                <div class="{severity_color[alert['severity']]}">
-                    <strong>{alert['severity']}: {alert['title']}</strong><br/>
-                    {alert['description']}<br/>
-                    <strong>Value:</strong> {alert['value']}<br/>
-                    <small>⏰ {alert['time']} | 📤 {alert['action']}</small>
-                </div>
-                """, unsafe_allow_html=True)
+            # Fixed alert list, formatted into HTML once and shared across reruns
+            st.markdown(active_alerts_html(), unsafe_allow_html=True)
         
         with col2:
             st.markdown("##### 📊 Alert Statistics")
             
-            alert_stats = pd.DataFrame({
-                "Type": ["Critical", "Warning", "Info"],
-                "Last 24h": [12, 45, 156],
-                "Last 7d": [89, 324, 1245]
-            })
+            alert_stats = load_alert_stats()
             
             st.dataframe(alert_stats, use_container_width=True, hide_index=True)
             
@@ -1683,16 +1730,12 @@ elif page == "⚙️ Layer 2: Processing":
                 help="Average time from alert generation to resolution"
             )
             
-            st.markdown("##### 📨 Notification Channels")
-            st.markdown("""
-            - 🔔 PagerDuty: **Enabled**
-            - 💬 Slack: **Enabled**
-            - 📧 Email: **Enabled**
-            - 📱 Teams: **Enabled**
-            """)
-
-elif page == "💾 Layer 3: Storage":
-    if st.session_state.show_help:
+            st.markdown(NOTIFICATION_CHANNELS_MD)
+
+
+def render_storage():
+    """Storage tiers and retention policies"""
+    if show_help:
         show_info_card(
             "💾 Storage & Lifecycle Management",
             "Data moves through storage tiers automatically based on age and access patterns. "
@@ -1706,7 +1749,7 @@ elif page == "💾 Layer 3: Storage":
     with tab1:
         st.subheader("🗄️ Splunk Indexer Cluster - Storage Tier Status")
         
-        if st.session_state.show_help:
+        if show_help:
             show_help_bubble("💡 Data automatically moves through tiers: Hot (fast, expensive) → Warm → Cold → Frozen (slow, cheap)")
         
         # Storage overview metrics
@@ -1721,42 +1764,21 @@ elif page == "💾 Layer 3: Storage":
         with col4:
             st.metric("Frozen/Archive", "234.5 TB", delta="+1.2 TB", help="Glacier - 1-7 years")
         
-        st.markdown("---")
+        st.divider()
         
         # Storage tier details
-        tier_data = {
-            "Tier": ["Hot (NVMe SSD)", "Warm (SATA SSD)", "Cold (S3)", "Frozen (Glacier)"],
-            "Capacity": ["5 TB", "15 TB", "100 TB", "500 TB"],
-            "Used": ["2.4 TB", "8.7 TB", "45.2 TB", "234.5 TB"],
-            "Usage %": ["48%", "58%", "45%", "47%"],
-            "Retention": ["7-30 days", "30-90 days", "90-365 days", "1-7 years"],
-            "Search Speed": ["< 1s", "2-5s", "10-30s", "1-12h"],
-            "Replication": ["3x", "2x", "1x", "1x"],
-            "Cost/GB/Month": ["$0.15", "$0.08", "$0.023", "$0.004"]
-        }
         
-        df = pd.DataFrame(tier_data)
+        df = load_storage_tiers()
         st.dataframe(df, use_container_width=True, hide_index=True)
         
-        st.markdown("---")
+        st.divider()
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("##### 📊 Storage Distribution")
             
-            sizes = [2.4, 8.7, 45.2, 234.5]
-            labels = ["Hot", "Warm", "Cold", "Frozen"]
-            
-            fig = go.Figure(data=[go.Pie(
-                labels=labels,
-                values=sizes,
-                hole=0.4,
-                marker=dict(colors=['#EF4444', '#F59E0B', '#3B82F6', '#8B5CF6']),
-                hovertemplate='<b>%{label}</b><br>Size: %{value} TB<br>Percentage: %{percent}<extra></extra>'
-            )])
-            fig.update_layout(height=300, margin=dict(l=0, r=0, t=0, b=0))
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(storage_distribution_figure(), use_container_width=True)
         
         with col2:
             st.markdown("##### 📈 Storage Growth Trend")
@@ -1782,7 +1804,7 @@ elif page == "💾 Layer 3: Storage":
             )
             st.plotly_chart(fig, use_container_width=True)
         
-        st.markdown("---")
+        st.divider()
         
         st.markdown("##### 🔄 Data Lifecycle Automation")
         
@@ -1799,75 +1821,91 @@ elif page == "💾 Layer 3: Storage":
     with tab2:
         st.subheader("📋 Data Retention Policies by Index")
         
-        if st.session_state.show_help:
+        if show_help:
             show_info_card(
                 "📋 Retention Policies",
                 "Different log types have different retention requirements based on compliance, " 
                 "business needs, and cost considerations. Security logs are kept longest for audit purposes."
             )
         
-        retention_data = {
-            "Index": ["aiml_models", "aiml_training", "aiml_rag", "infrastructure", "security_audit", "devops_ci_cd"],
-            "Hot": ["14 days", "7 days", "14 days", "3 days", "30 days", "7 days"],
-            "Warm": ["60 days", "30 days", "60 days", "14 days", "90 days", "30 days"],
-            "Cold": ["180 days", "90 days", "180 days", "90 days", "365 days", "90 days"],
-            "Archive": ["3 years", "1 year", "3 years", "Purge", "7 years", "1 year"],
-            "Total Size": ["12.5 TB", "8.3 TB", "15.7 TB", "45.2 TB", "23.4 TB", "5.6 TB"],
-            "Compliance": ["SOC2", "Internal", "SOC2", "Internal", "SOC2, HIPAA, GDPR", "Internal"]
-        }
         
-        df = pd.DataFrame(retention_data)
+        df = load_retention_policies()
         st.dataframe(df, use_container_width=True, hide_index=True)
         
-        st.markdown("---")
+        st.divider()
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("##### 💰 Storage Cost by Index")
             
-            indices = list(retention_data["Index"])
-            costs = [1245, 834, 1570, 452, 2340, 560]
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=indices,
-                y=costs,
-                marker_color='#8B5CF6',
-                text=[f"${c}" for c in costs],
-                textposition='outside',
-                hovertemplate='<b>%{x}</b><br>Monthly Cost: $%{y}<extra></extra>'
-            ))
-            fig.update_layout(
-                height=300,
-                margin=dict(l=0, r=0, t=0, b=0),
-                xaxis_title="Index",
-                yaxis_title="Monthly Cost (USD)",
-                xaxis_tickangle=-45
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(storage_cost_figure(), use_container_width=True)
         
         with col2:
             st.markdown("##### 🔄 Data Movement Events (Last 24h)")
             
-            movements = {
-                "Hot → Warm": 2345,
-                "Warm → Cold": 1876,
-                "Cold → Frozen": 456,
-                "Frozen → Purge": 89
-            }
-            
-            fig = go.Figure(data=[go.Pie(
-                labels=list(movements.keys()),
-                values=list(movements.values()),
-                hole=0.3,
-                hovertemplate='<b>%{label}</b><br>Events: %{value:,}<extra></extra>'
-            )])
-            fig.update_layout(height=300, margin=dict(l=0, r=0, t=0, b=0))
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(data_movement_figure(), use_container_width=True)
 
-elif page == "📊 Layer 4: Consumption":
-    if st.session_state.show_help:
+
+@st.cache_resource
+def integrations_html():
+    """Collapsible integration cards for the Consumption page, rendered to HTML once"""
+    integrations = {
+        "ServiceNow": {
+            "status": "🟢 Connected",
+            "description": "ITSM Ticketing",
+            "metrics": {"Incidents Created (24h)": 12, "Avg Resolution Time": "2.3 hours"}
+        },
+        "PagerDuty": {
+            "status": "🟢 Connected",
+            "description": "Incident Management",
+            "metrics": {"Alerts Sent (24h)": 45, "On-Call Engineers": 8}
+        },
+        "Slack": {
+            "status": "🟢 Connected",
+            "description": "ChatOps Notifications",
+            "metrics": {"Messages Sent (24h)": 234, "Channels": 12}
+        },
+        "Grafana": {
+            "status": "🟢 Connected",
+            "description": "Metrics Visualization",
+            "metrics": {"Dashboards": 23, "Active Users": 156}
+        },
+        "Datadog": {
+            "status": "🟢 Connected",
+            "description": "APM & Tracing",
+            "metrics": {"Traces/sec": 2345, "Services Monitored": 45}
+        },
+        "Azure AD": {
+            "status": "🟢 Connected",
+            "description": "SSO Authentication",
+            "metrics": {"Active Users": 234, "Auth Requests (24h)": 5678}
+        }
+    }
+    
+    parts = []
+    for name, details in integrations.items():
+        metrics = "".join(
+            f"<li>{metric}: <strong>{value}</strong></li>" for metric, value in details['metrics'].items()
+        )
+        parts.append(
+            "<details class='integration-card'>"
+            f"<summary>{details['status']} <strong>{name}</strong> - {details['description']}</summary>"
+            "<div class='integration-body'>"
+            "<div><strong>Configuration</strong><ul>"
+            f"<li>Status: {details['status']}</li>"
+            f"<li>Type: {details['description']}</li>"
+            "<li>Authentication: ✅ OAuth2</li>"
+            "<li>Last Sync: 2 minutes ago</li>"
+            "</ul></div>"
+            f"<div><strong>Metrics (Last 24h)</strong><ul>{metrics}</ul></div>"
+            "</div></details>"
+        )
+    return "".join(parts)
+
+def render_consumption():
+    """Dashboards, API explorer and integrations"""
+    if show_help:
         show_info_card(
             "📊 Consumption & Visualization Layer",
             "This layer provides dashboards, APIs, and integrations for consuming the observability data. "
@@ -1888,7 +1926,7 @@ elif page == "📊 Layer 4: Consumption":
         )
         
         if dashboard_type == "AI/ML Operations":
-            if st.session_state.show_help:
+            if show_help:
                 show_help_bubble("📊 This dashboard provides real-time insights into all AI/ML models across your organization")
             
             col1, col2, col3 = st.columns(3)
@@ -1904,14 +1942,13 @@ elif page == "📊 Layer 4: Consumption":
             
             with col1:
                 # Model comparison
-                models = ["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro", "Mistral-7B"]
                 metrics = {
                     "Latency (ms)": [850, 920, 1200, 780, 950],
                     "Cost ($/1K)": [0.0030, 0.0025, 0.0015, 0.0028, 0.0020],
                     "Quality Score": [0.94, 0.96, 0.87, 0.93, 0.89]
                 }
                 
-                df = pd.DataFrame(metrics, index=models)
+                df = pd.DataFrame(metrics, index=MODEL_NAMES)
                 st.dataframe(df, use_container_width=True)
             
             with col2:
@@ -1938,7 +1975,7 @@ elif page == "📊 Layer 4: Consumption":
                 st.plotly_chart(fig, use_container_width=True)
         
         elif dashboard_type == "Cost Analytics":
-            if st.session_state.show_help:
+            if show_help:
                 show_help_bubble("💰 Track and optimize AI/ML costs across teams, models, and time periods")
             
             col1, col2 = st.columns(2)
@@ -1990,7 +2027,7 @@ elif page == "📊 Layer 4: Consumption":
     with tab2:
         st.subheader("🔌 Splunk REST API Explorer")
         
-        if st.session_state.show_help:
+        if show_help:
             show_info_card(
                 "🔌 API Access",
                 "Use REST APIs to programmatically access Splunk data. " 
@@ -2023,11 +2060,18 @@ elif page == "📊 Layer 4: Consumption":
                 "count": 100
             }
         
-        st.json(request_body)
+        # A flat parameter dict reads fine as a table and skips the JSON tree component.
+        # SPL pipes are escaped so they don't split the table cells
+        param_rows = "\n".join(
+            "| `{}` | `{}` |".format(key, str(value).replace("|", "\\|"))
+            for key, value in request_body.items()
+        )
+        st.markdown("| Parameter | Value |\n|---|---|\n" + param_rows)
         
         if st.button("🚀 Execute API Call", type="primary"):
             with st.spinner("Executing API request..."):
-                time.sleep(1)
+                if not minimal_ui:
+                    time.sleep(1)
                 
                 st.success("✅ API call successful (Response time: 234ms)")
                 
@@ -2071,60 +2115,64 @@ for result in job.results():
     with tab3:
         st.subheader("🔗 External System Integrations")
         
-        if st.session_state.show_help:
+        if show_help:
             show_help_bubble("🔗 Pre-configured integrations with ITSM, incident management, and collaboration tools")
         
-        integrations = {
-            "ServiceNow": {
-                "status": "🟢 Connected",
-                "description": "ITSM Ticketing",
-                "metrics": {"Incidents Created (24h)": 12, "Avg Resolution Time": "2.3 hours"}
-            },
-            "PagerDuty": {
-                "status": "🟢 Connected",
-                "description": "Incident Management",
-                "metrics": {"Alerts Sent (24h)": 45, "On-Call Engineers": 8}
-            },
-            "Slack": {
-                "status": "🟢 Connected",
-                "description": "ChatOps Notifications",
-                "metrics": {"Messages Sent (24h)": 234, "Channels": 12}
-            },
-            "Grafana": {
-                "status": "🟢 Connected",
-                "description": "Metrics Visualization",
-                "metrics": {"Dashboards": 23, "Active Users": 156}
-            },
-            "Datadog": {
-                "status": "🟢 Connected",
-                "description": "APM & Tracing",
-                "metrics": {"Traces/sec": 2345, "Services Monitored": 45}
-            },
-            "Azure AD": {
-                "status": "🟢 Connected",
-                "description": "SSO Authentication",
-                "metrics": {"Active Users": 234, "Auth Requests (24h)": 5678}
-            }
-        }
-        
-        for name, details in integrations.items():
-            with st.expander(f"{details['status']} **{name}** - {details['description']}", expanded=False):
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("**Configuration**")
-                    st.markdown(f"- Status: {details['status']}")
-                    st.markdown(f"- Type: {details['description']}")
-                    st.markdown("- Authentication: ✅ OAuth2")
-                    st.markdown("- Last Sync: 2 minutes ago")
-                
-                with col2:
-                    st.markdown("**Metrics (Last 24h)**")
-                    for metric, value in details['metrics'].items():
-                        st.markdown(f"- {metric}: **{value}**")
+        # Static content, so the collapsible sections are pre-rendered to one HTML block
+        st.markdown(integrations_html(), unsafe_allow_html=True)
 
-elif page == "🔗 End-to-End Tracing":
-    if st.session_state.show_help:
+
+# Everything the tracing page derives from a generated chain. The chain never changes once
+# generated, so the timeline figure, table and totals are built with it, not on every rerun
+Trace = namedtuple('Trace', 'trace_id chain figure table total_ms slowest')
+
+def build_trace():
+    """Generate a RAG chain along with its timeline figure, stage table and summary values"""
+    trace_id, chain = generate_rag_chain()
+    
+    # Create Gantt-like chart
+    durations = []
+    cumulative_time = 0
+    
+    for step in chain:
+        durations.append(step['latency_ms'])
+        cumulative_time += step['latency_ms']
+    
+    colors = ['#10B981', '#3B82F6', '#8B5CF6', '#F59E0B', '#EF4444', '#6B7280']
+    
+    # One bar trace for the whole chain instead of a trace per stage; per-stage colours
+    # and hover details are passed as arrays
+    fig = go.Figure(go.Bar(
+        x=durations,
+        y=[step['stage'] for step in chain],
+        orientation='h',
+        marker=dict(color=[colors[i % len(colors)] for i in range(len(chain))]),
+        text=[f"{d}ms" for d in durations],
+        textposition='inside',
+        customdata=[(step['service'], step['status']) for step in chain],
+        hovertemplate="<b>%{y}</b><br>" +
+                      "Service: %{customdata[0]}<br>" +
+                      "Latency: %{x}ms<br>" +
+                      "Status: %{customdata[1]}<br>" +
+                      "<extra></extra>"
+    ))
+    
+    fig.update_layout(
+        height=350,
+        margin=dict(l=0, r=0, t=0, b=0),
+        barmode='stack',
+        showlegend=False,
+        xaxis_title="Time (ms)",
+        yaxis_title="Stage"
+    )
+    
+    table = pd.DataFrame(chain)[['timestamp', 'stage', 'service', 'latency_ms', 'status']]
+    slowest = max(chain, key=lambda x: x['latency_ms'])
+    return Trace(trace_id, chain, fig, table, cumulative_time, slowest)
+
+def render_tracing():
+    """RAG chain trace timeline and breakdown"""
+    if show_help:
         show_info_card(
             "🔗 End-to-End Request Tracing",
             "Trace complete request flows through your RAG pipeline. " 
@@ -2142,16 +2190,16 @@ elif page == "🔗 End-to-End Tracing":
     
     with col1:
         if st.button("🎲 Generate New RAG Chain Trace", type="primary", use_container_width=True):
-            trace_id, chain = generate_rag_chain()
-            st.session_state.current_trace = (trace_id, chain)
+            st.session_state.current_trace = build_trace()
     
     with col2:
         st.code("traceparent: 00-4bf92f...-01", language="text")
     
-    if 'current_trace' in st.session_state:
-        trace_id, chain = st.session_state.current_trace
+    current_trace = st.session_state.get('current_trace')
+    if current_trace is not None:
+        trace_id, chain = current_trace.trace_id, current_trace.chain
         
-        if st.session_state.show_help:
+        if show_help:
             show_help_bubble("🔍 This timeline shows each stage of the RAG pipeline execution with exact timing")
         
         st.markdown(f"### 🔍 Trace ID: `{trace_id}`")
@@ -2159,75 +2207,33 @@ elif page == "🔗 End-to-End Tracing":
         # Timeline visualization
         st.markdown("##### ⏱️ Execution Timeline")
         
-        # Create Gantt-like chart
-        start_times = []
-        durations = []
-        cumulative_time = 0
-        
-        for step in chain:
-            start_times.append(cumulative_time)
-            durations.append(step['latency_ms'])
-            cumulative_time += step['latency_ms']
-        
-        fig = go.Figure()
-        
-        colors = ['#10B981', '#3B82F6', '#8B5CF6', '#F59E0B', '#EF4444', '#6B7280']
-        
-        for i, step in enumerate(chain):
-            fig.add_trace(go.Bar(
-                name=step['stage'],
-                x=[durations[i]],
-                y=[step['stage']],
-                orientation='h',
-                marker=dict(color=colors[i % len(colors)]),
-                text=f"{durations[i]}ms",
-                textposition='inside',
-                hovertemplate=f"<b>{step['stage']}</b><br>" +
-                             f"Service: {step['service']}<br>" +
-                             f"Latency: {step['latency_ms']}ms<br>" +
-                             f"Status: {step['status']}<br>" +
-                             f"<extra></extra>"
-            ))
-        
-        fig.update_layout(
-            height=350,
-            margin=dict(l=0, r=0, t=0, b=0),
-            barmode='stack',
-            showlegend=False,
-            xaxis_title="Time (ms)",
-            yaxis_title="Stage"
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        # Built with the trace, so reruns that don't generate a new one reuse the figure
+        st.plotly_chart(current_trace.figure, use_container_width=True)
         
         # Detailed breakdown
         st.markdown("##### 📋 Stage Details")
         
-        chain_df = pd.DataFrame(chain)
-        chain_df = chain_df[['timestamp', 'stage', 'service', 'latency_ms', 'status']]
-        st.dataframe(chain_df, use_container_width=True, hide_index=True)
+        st.dataframe(current_trace.table, use_container_width=True, hide_index=True)
         
         # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
         
-        total_latency = sum(step['latency_ms'] for step in chain)
-        
         with col1:
-            st.metric("Total Latency", f"{total_latency}ms", help="Sum of all stage latencies")
+            st.metric("Total Latency", f"{current_trace.total_ms}ms", help="Sum of all stage latencies")
         with col2:
             st.metric("Stages Completed", len(chain), help="Number of pipeline stages")
         with col3:
             st.metric("Success Rate", "100%", help="Percentage of successful stages")
         with col4:
-            slowest = max(chain, key=lambda x: x['latency_ms'])
+            slowest = current_trace.slowest
             st.metric("Slowest Stage", slowest['stage'], help=f"{slowest['latency_ms']}ms")
         
-        st.markdown("---")
+        st.divider()
         
         # SPL Query to retrieve this trace
         st.markdown("##### 💻 SPL Query to Reconstruct This Chain")
         
-        if st.session_state.show_help:
+        if show_help:
             show_info_card(
                 "💻 Trace Reconstruction",
                 "This SPL query retrieves all log entries with the same trace ID and orders them chronologically. " 
@@ -2241,10 +2247,12 @@ elif page == "🔗 End-to-End Tracing":
         
         st.code(spl_query, language="spl")
         
-        # Raw log samples
-        with st.expander("📄 View Raw Log Samples"):
-            for step in chain:
-                st.json({
+        # Raw log samples. A collapsed expander still builds and sends its body, so the
+        # samples are only rendered once the toggle is switched on
+        if st.toggle("📄 View Raw Log Samples", key="show_raw_samples"):
+            # One JSON viewer for the whole chain rather than one per stage
+            st.json([
+                {
                     "timestamp": step['timestamp'],
                     "trace_id": trace_id,
                     "service": step['service'],
@@ -2253,10 +2261,14 @@ elif page == "🔗 End-to-End Tracing":
                     "status": step['status'],
                     "environment": "production",
                     "region": "us-west-2"
-                })
+                }
+                for step in chain
+            ])
 
-else:  # Real-time Monitoring
-    if st.session_state.show_help:
+
+def render_monitoring():
+    """Live system metrics with optional auto-refresh"""
+    if show_help:
         show_info_card(
             "⚡ Real-time System Monitoring",
             "Live dashboard showing current system status across all components. " 
@@ -2274,135 +2286,155 @@ else:  # Real-time Monitoring
         help="Automatically refresh metrics every 5 seconds"
     )
     
-    if auto_refresh:
-        time.sleep(5)
-        st.rerun()
-    
-    if st.session_state.show_help:
+    if show_help:
         show_help_bubble("📊 All metrics refresh automatically when auto-refresh is enabled")
     
-    # Real-time metrics
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        st.metric(
-            "Ingestion Rate", 
-            f"{random.randint(2500, 3500)}/s", 
-            delta=f"+{random.randint(50, 200)}",
-            help="Events ingested per second"
-        )
-    with col2:
-        st.metric(
-            "Query Load", 
-            f"{random.randint(150, 250)}/s", 
-            delta=f"+{random.randint(-20, 30)}",
-            help="Search queries per second"
-        )
-    with col3:
-        st.metric(
-            "Indexer CPU", 
-            f"{random.randint(45, 75)}%", 
-            delta=f"+{random.randint(-5, 10)}%",
-            help="Average CPU across indexers"
-        )
-    with col4:
-        st.metric(
-            "Network I/O", 
-            f"{random.randint(800, 1200)} Mbps", 
-            delta=f"+{random.randint(-50, 100)}",
-            help="Network throughput"
-        )
-    with col5:
-        st.metric(
-            "Active Queries", 
-            f"{random.randint(50, 100)}", 
-            delta=f"+{random.randint(-10, 15)}",
-            help="Currently executing queries"
-        )
-    
-    st.markdown("---")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("##### 📊 Live Ingestion Rate")
+    def show_live_metrics():
+        """Live metrics, charts and cluster health for the monitoring page"""
+        # Real-time metrics
+        col1, col2, col3, col4, col5 = st.columns(5)
         
-        # Generate live data
-        seconds = list(range(60))
-        rates = [random.randint(2000, 4000) for _ in range(60)]
+        with col1:
+            st.metric(
+                "Ingestion Rate", 
+                f"{random.randint(2500, 3500)}/s", 
+                delta=f"+{random.randint(50, 200)}",
+                help="Events ingested per second"
+            )
+        with col2:
+            st.metric(
+                "Query Load", 
+                f"{random.randint(150, 250)}/s", 
+                delta=f"+{random.randint(-20, 30)}",
+                help="Search queries per second"
+            )
+        with col3:
+            st.metric(
+                "Indexer CPU", 
+                f"{random.randint(45, 75)}%", 
+                delta=f"+{random.randint(-5, 10)}%",
+                help="Average CPU across indexers"
+            )
+        with col4:
+            st.metric(
+                "Network I/O", 
+                f"{random.randint(800, 1200)} Mbps", 
+                delta=f"+{random.randint(-50, 100)}",
+                help="Network throughput"
+            )
+        with col5:
+            st.metric(
+                "Active Queries", 
+                f"{random.randint(50, 100)}", 
+                delta=f"+{random.randint(-10, 15)}",
+                help="Currently executing queries"
+            )
         
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=seconds,
-            y=rates,
-            mode='lines',
-            fill='tozeroy',
-            line=dict(color='#10B981', width=2),
-            fillcolor='rgba(16, 185, 129, 0.2)',
-            hovertemplate='<b>%{x} sec ago</b><br>Rate: %{y} logs/sec<extra></extra>'
-        ))
-        fig.update_layout(
-            height=300,
-            margin=dict(l=0, r=0, t=0, b=0),
-            xaxis_title="Seconds Ago",
-            yaxis_title="Events/sec"
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        st.markdown("##### ⚡ Query Response Time")
+        st.divider()
         
-        seconds = list(range(60))
-        response_times = [random.randint(200, 1000) for _ in range(60)]
+        col1, col2 = st.columns(2)
         
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=seconds,
-            y=response_times,
-            mode='lines',
-            line=dict(color='#3B82F6', width=2),
-            hovertemplate='<b>%{x} sec ago</b><br>Response: %{y}ms<extra></extra>'
-        ))
-        fig.add_hline(
-            y=800, 
-            line_dash="dash", 
-            line_color="red",
-            annotation_text="SLA Threshold (800ms)",
-            annotation_position="right"
-        )
-        fig.update_layout(
-            height=300,
-            margin=dict(l=0, r=0, t=0, b=0),
-            xaxis_title="Seconds Ago",
-            yaxis_title="Response Time (ms)"
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    st.markdown("---")
-    
-    st.markdown("##### 🖥️ Cluster Health")
-    
-    if st.session_state.show_help:
-        show_help_bubble("🖥️ Monitor the health and resource usage of all cluster components in real-time")
-    
-    # Cluster status
-    cluster_data = {
-        "Component": ["Search Head 1", "Search Head 2", "Search Head 3", "Indexer 1", "Indexer 2", 
-                     "Indexer 3", "Indexer 4", "Master Node", "License Server", "Deployment Server"],
-        "Status": ["🟢 Healthy", "🟢 Healthy", "🟢 Healthy", "🟢 Healthy", "🟢 Healthy",
-                  "🟢 Healthy", "🟡 Warning", "🟢 Healthy", "🟢 Healthy", "🟢 Healthy"],
-        "CPU %": [f"{random.randint(30, 70)}%" for _ in range(10)],
-        "Memory %": [f"{random.randint(40, 80)}%" for _ in range(10)],
-        "Disk %": [f"{random.randint(20, 60)}%" for _ in range(10)],
-        "Network": [f"{random.randint(500, 1500)} Mbps" for _ in range(10)]
-    }
+        with col1:
+            st.markdown("##### 📊 Live Ingestion Rate")
+        
+            # Generate live data
+            seconds = list(range(60))
+            rates = [random.randint(2000, 4000) for _ in range(60)]
+        
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=seconds,
+                y=rates,
+                mode='lines',
+                fill='tozeroy',
+                line=dict(color='#10B981', width=2),
+                fillcolor='rgba(16, 185, 129, 0.2)',
+                hovertemplate='<b>%{x} sec ago</b><br>Rate: %{y} logs/sec<extra></extra>'
+            ))
+            fig.update_layout(
+                height=300,
+                margin=dict(l=0, r=0, t=0, b=0),
+                xaxis_title="Seconds Ago",
+                yaxis_title="Events/sec"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            st.markdown("##### ⚡ Query Response Time")
+        
+            seconds = list(range(60))
+            response_times = [random.randint(200, 1000) for _ in range(60)]
+        
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=seconds,
+                y=response_times,
+                mode='lines',
+                line=dict(color='#3B82F6', width=2),
+                hovertemplate='<b>%{x} sec ago</b><br>Response: %{y}ms<extra></extra>'
+            ))
+            fig.add_hline(
+                y=800, 
+                line_dash="dash", 
+                line_color="red",
+                annotation_text="SLA Threshold (800ms)",
+                annotation_position="right"
+            )
+            fig.update_layout(
+                height=300,
+                margin=dict(l=0, r=0, t=0, b=0),
+                xaxis_title="Seconds Ago",
+                yaxis_title="Response Time (ms)"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        st.divider()
+        
+        st.markdown("##### 🖥️ Cluster Health")
+        
+        if show_help:
+            show_help_bubble("🖥️ Monitor the health and resource usage of all cluster components in real-time")
+        
+        # Cluster status
+        cluster_data = {
+            "Component": ["Search Head 1", "Search Head 2", "Search Head 3", "Indexer 1", "Indexer 2", 
+                         "Indexer 3", "Indexer 4", "Master Node", "License Server", "Deployment Server"],
+            "Status": ["🟢 Healthy", "🟢 Healthy", "🟢 Healthy", "🟢 Healthy", "🟢 Healthy",
+                      "🟢 Healthy", "🟡 Warning", "🟢 Healthy", "🟢 Healthy", "🟢 Healthy"],
+            "CPU %": [f"{random.randint(30, 70)}%" for _ in range(10)],
+            "Memory %": [f"{random.randint(40, 80)}%" for _ in range(10)],
+            "Disk %": [f"{random.randint(20, 60)}%" for _ in range(10)],
+            "Network": [f"{random.randint(500, 1500)} Mbps" for _ in range(10)]
+        }
+        
+        df = pd.DataFrame(cluster_data)
+        st.dataframe(df, use_container_width=True, hide_index=True)
     
-    df = pd.DataFrame(cluster_data)
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    if fragment is not None:
+        # Only this function reruns on the timer; header, sidebar and footer are left alone
+        fragment(run_every=5 if auto_refresh else None)(show_live_metrics)()
+    else:
+        show_live_metrics()
+        if auto_refresh:
+            time.sleep(5)
+            st.rerun()
+
+# Each page is a function; the selected one is looked up and called directly
+PAGES = {
+    "🏠 Overview Dashboard": render_overview,
+    "📥 Layer 1: Log Ingestion": render_log_ingestion,
+    "⚙️ Layer 2: Processing": render_processing,
+    "💾 Layer 3: Storage": render_storage,
+    "📊 Layer 4: Consumption": render_consumption,
+    "🔗 End-to-End Tracing": render_tracing,
+    "⚡ Real-time Monitoring": render_monitoring
+}
 
-# Footer
-st.markdown("---")
-st.markdown("""
+PAGES[page]()
+
+# Footer. The divider and footer text go out as one element; the HTML never changes
+FOOTER_HTML = """
+<hr>
 <div style='text-align: center; color: #6B7280; padding: 2rem 0;'>
     <p><strong>🔍 AI/ML Observability Platform</strong> | Interactive Prototype v1.0</p>
     <p style='font-size: 0.9rem;'>Powered by Splunk | Built for Demonstration & Education</p>
@@ -2410,4 +2442,6 @@ st.markdown("""
         💡 <strong>Tip:</strong> Explore all layers to see the complete platform capabilities
     </p>
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+"""
+
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)